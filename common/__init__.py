@@ -1,6 +1,9 @@
 from .utils import (
     Information,
     get_openai_client,
+    get_shared_openai_client,
+    get_async_openai_client,
+    get_shared_async_openai_client,
     get_google_sheets_client,
     get_spreadsheet,
 )
@@ -8,6 +11,9 @@ from .utils import (
 __all__ = [
     "Information",
     "get_openai_client",
+    "get_shared_openai_client",
+    "get_async_openai_client",
+    "get_shared_async_openai_client",
     "get_google_sheets_client",
     "get_spreadsheet",
 ]
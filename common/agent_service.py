@@ -1,24 +1,397 @@
 """Extensible agent service layer for universal AI agent workflow."""
 
-import datetime
+import functools
 import logging
-import uuid
 import os
 import requests
 import hashlib
 import json
-from typing import Dict, Any
+import math
+import orjson
+import secrets
+import threading
+import time
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 
-from common import get_openai_client, get_google_sheets_client, get_spreadsheet
+from gspread.utils import ValueInputOption, rowcol_to_a1
+
+from common import get_shared_openai_client, get_google_sheets_client, get_spreadsheet
 
 # Budget configuration now comes from agent YAML via FullAgentConfig
 from common.config import AgentDefinition, FullAgentConfig
-from common.config.models import BudgetTierConfig
 from pathlib import Path
 from common.http_utils import is_testing_mode
+from common.prompt_manager import prompt_manager
+
+
+from .errors import AnalysisError, ValidationError
+
+
+class _FingerprintBloomFilter:
+    """Process-local Bloom filter over job IDs already written to the sheet.
+
+    A miss means the job ID is definitely not in the sheet as of the last
+    sync, so the Sheets lookup can be skipped. A hit may be a false positive
+    and must still be confirmed against the sheet.
+    """
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.001):
+        num_bits = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self._num_bits = num_bits
+        self._num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        self._bits = bytearray((num_bits + 7) // 8)
+
+    def _positions(self, key: str) -> Iterable[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        return ((h1 + i * h2) % self._num_bits for i in range(self._num_hashes))
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+# Per-spreadsheet job ID filters, re-synced from column A every
+# _FP_BLOOM_SYNC_SECONDS. Job IDs written by this process are added as they
+# are written; rows written by other workers only appear after the next sync,
+# so a duplicate submitted through another worker within that window is not
+# detected. The window is bounded by _FP_BLOOM_SYNC_SECONDS.
+_FP_BLOOMS: Dict[str, Tuple[_FingerprintBloomFilter, float]] = {}
+# Spreadsheets with a sync in flight, mapped to job IDs written meanwhile
+_FP_BLOOM_REFRESHING: Dict[str, List[str]] = {}
+_FP_BLOOM_LOCK = threading.Lock()
+_FP_BLOOM_SYNC_SECONDS = 60
+
+
+def _get_fingerprint_filter(spreadsheet_id: str, worksheet) -> Optional[_FingerprintBloomFilter]:
+    """Get the job ID filter for a spreadsheet, rebuilding it from column A if stale.
+
+    The column is read without holding the lock. While one caller syncs a
+    stale filter, other callers get None and fall back to the Sheets lookup.
+
+    Args:
+        spreadsheet_id: Spreadsheet the filter covers
+        worksheet: Worksheet holding job IDs in column A
+
+    Returns:
+        Synced filter, or None if it is being synced or the sheet could not be read
+    """
+    with _FP_BLOOM_LOCK:
+        synced_at = time.monotonic()
+        cached = _FP_BLOOMS.get(spreadsheet_id)
+        if cached is not None and synced_at - cached[1] < _FP_BLOOM_SYNC_SECONDS:
+            return cached[0]
+        if spreadsheet_id in _FP_BLOOM_REFRESHING:
+            return None
+        _FP_BLOOM_REFRESHING[spreadsheet_id] = []
+
+    bloom = _FingerprintBloomFilter()
+    try:
+        for job_id in worksheet.col_values(1):
+            if isinstance(job_id, str) and job_id.startswith("fp_"):
+                bloom.add(job_id)
+    except Exception as e:
+        logging.warning(f"Could not sync job fingerprint filter: {str(e)}")
+        bloom = None
+
+    with _FP_BLOOM_LOCK:
+        written_meanwhile = _FP_BLOOM_REFRESHING.pop(spreadsheet_id)
+        if bloom is None:
+            return None
+        for job_id in written_meanwhile:
+            bloom.add(job_id)
+        _FP_BLOOMS[spreadsheet_id] = (bloom, synced_at)
+    return bloom
+
+
+def _remember_job_id(spreadsheet_id: str, job_id: str) -> None:
+    """Record a newly written job ID in the spreadsheet's filter, if one is loaded."""
+    with _FP_BLOOM_LOCK:
+        cached = _FP_BLOOMS.get(spreadsheet_id)
+        if cached is not None:
+            cached[0].add(job_id)
+        written_meanwhile = _FP_BLOOM_REFRESHING.get(spreadsheet_id)
+        if written_meanwhile is not None:
+            written_meanwhile.append(job_id)
+
+
+# Agent configs shared across AnalysisService instances, keyed by (yaml_path, mtime_ns).
+# Entries expire so edits to the Google Sheet schema rows are still picked up.
+_AGENT_CONFIG_CACHE: Dict[Tuple[str, int], Tuple[FullAgentConfig, float]] = {}
+_AGENT_CONFIG_TTL_SECONDS = 300
+
+
+@functools.lru_cache(maxsize=1)
+def _find_yaml_path() -> Path:
+    """Locate agents/business_evaluation.yaml; the result is fixed for the process.
+
+    JOEYBOT_AGENTS_DIR points straight at the agents directory and skips the
+    filesystem search, which saves the stat calls on Azure cold starts.
+
+    Raises:
+        ValueError: If the agent definition cannot be found
+    """
+    agents_dir = os.environ.get("JOEYBOT_AGENTS_DIR")
+    if agents_dir:
+        return Path(agents_dir) / 'business_evaluation.yaml'
+
+    # Find project root - try multiple strategies for different environments
+    current_path = Path(__file__).resolve()
+    project_root = None
+
+    # Strategy 1: Look for pyproject.toml (local development)
+    for parent in current_path.parents:
+        if (parent / 'pyproject.toml').exists():
+            project_root = parent
+            break
+
+    # Strategy 2: Look for agents/ directory (Azure Functions deployment)
+    if project_root is None:
+        for parent in current_path.parents:
+            if (parent / 'agents' / 'business_evaluation.yaml').exists():
+                project_root = parent
+                break
+
+    # Strategy 3: Assume agents/ is at same level as current directory structure
+    if project_root is None:
+        # In Azure Functions, common/ and agents/ are typically siblings
+        common_parent = current_path.parent.parent  # Go up from common/
+        if (common_parent / 'agents' / 'business_evaluation.yaml').exists():
+            project_root = common_parent
+
+    if project_root is None:
+        raise ValueError(
+            "Could not find project root or agents/business_evaluation.yaml file"
+        )
+
+    return project_root / 'agents' / 'business_evaluation.yaml'
+
+
+_pricepoints_cache: Tuple[Optional[FullAgentConfig], Tuple[Dict[str, Any], ...]] = (None, ())
+
+
+def _get_pricepoints(config: FullAgentConfig) -> Tuple[Dict[str, Any], ...]:
+    """Get pricing options for a config, reusing the ones built for the last config.
+
+    Pricepoints depend only on the agent config, not on the request. The result
+    is shared across requests and must not be modified; callers that hand it
+    out use _copy_pricepoints().
+    """
+    global _pricepoints_cache
+
+    cached_config, pricepoints = _pricepoints_cache
+    if cached_config is config:
+        return pricepoints
+
+    research_model = config.get_model('research')  # Use unified model resolution
+
+    # Generate pricing options from universal budget configuration
+    pricepoints = tuple(
+        {
+            "level": tier.name,
+            "name": f"{tier.name.title()} Analysis",
+            "max_cost": price,
+            "estimated_cost": price,
+            "model": research_model,
+            "description": tier.description,
+            "deliverables": tuple(tier.deliverables),
+            "time_estimate": getattr(
+                tier,
+                'time_estimate',
+                f"{(1 + tier.num_research_calls + 1) * 5}-{(1 + tier.num_research_calls + 1) * 10} minutes",
+            ),
+        }
+        for tier in config.get_budget_tiers()
+        for price in (tier.calculate_price(config),)
+    )
+
+    _pricepoints_cache = (config, pricepoints)
+    return pricepoints
+
+
+def _copy_pricepoints(pricepoints: Tuple[Dict[str, Any], ...]) -> List[Dict[str, Any]]:
+    """Copy cached pricepoints so callers can modify them without touching the cache."""
+    return [
+        {**pricepoint, "deliverables": list(pricepoint["deliverables"])}
+        for pricepoint in pricepoints
+    ]
+
+
+_BUDGET_OPTIONS_MESSAGE = "Select a budget tier and call /api/execute_analysis to start the analysis"
+
+
+_budget_prefix_cache: Tuple[Optional[FullAgentConfig], bytes] = (None, b"")
+
+
+def _get_budget_options_prefix(config: FullAgentConfig) -> bytes:
+    """Get the serialized, request-invariant part of the budget options response.
+
+    Returns the JSON object for agent_type/pricepoints/message/next_endpoint with
+    its closing brace stripped, so per-request fields can be appended.
+    """
+    global _budget_prefix_cache
+
+    cached_config, prefix = _budget_prefix_cache
+    if cached_config is config:
+        return prefix
+
+    prefix = orjson.dumps(
+        {
+            "agent_type": config.definition.agent_id,
+            "pricepoints": _get_pricepoints(config),
+            "message": _BUDGET_OPTIONS_MESSAGE,
+            "next_endpoint": "/api/execute_analysis",
+        }
+    )[:-1]
+
+    _budget_prefix_cache = (config, prefix)
+    return prefix
+
+
+def _has_value(value: Any) -> bool:
+    """Check that a user input value is present and not blank."""
+    if isinstance(value, str):
+        # Fast path for the common case: no str() copy or strip() allocation
+        return bool(value) and not value.isspace()
+    return bool(str(value).strip())
+
+
+def _normalize_fingerprint_input(user_input: Dict[str, Any]) -> Dict[str, Any]:
+    """Casefold text values and collapse their whitespace for job fingerprinting."""
+    return {
+        key: " ".join(value.split()).casefold() if isinstance(value, str) else value
+        for key, value in user_input.items()
+    }
+
+
+def _iso_now() -> str:
+    """Current UTC time as an ISO 8601 string with milliseconds, e.g. 2025-01-28T12:00:00.123Z.
+
+    Formats from time.time() directly to avoid building a datetime per response.
+    """
+    now = time.time()
+    t = time.gmtime(now)
+    return "%04d-%02d-%02dT%02d:%02d:%02d.%03dZ" % (
+        t.tm_year, t.tm_mon, t.tm_mday, t.tm_hour, t.tm_min, t.tm_sec, int(now % 1 * 1000)
+    )
+
+
+def _start_orchestration(orchestrator_url: str, orchestration_input: Dict[str, Any]) -> str:
+    """Start the durable orchestration for a job via the orchestrator HTTP endpoint.
+
+    Returns:
+        Orchestration instance ID
+
+    Raises:
+        AnalysisError: If the orchestrator did not accept the start request
+    """
+    logging.info(f"[DURABLE-START] Calling orchestrator at: {orchestrator_url}")
+    logging.info(f"[DURABLE-START] Orchestration input: {orchestration_input}")
+
+    try:
+        response = requests.post(
+            orchestrator_url,
+            json=orchestration_input,
+            timeout=30  # 30 second timeout for starting orchestration
+        )
+    except Exception as e:
+        logging.error(f"[DURABLE-START] Exception starting orchestration: {str(e)}")
+        raise AnalysisError(f"Failed to start orchestration: {str(e)}") from e
+
+    if response.status_code not in (200, 202):
+        logging.error(f"[DURABLE-START] Failed to start orchestration: HTTP {response.status_code}")
+        logging.error(f"[DURABLE-START] Response body: {response.text}")
+        raise AnalysisError(f"Failed to start orchestration: HTTP {response.status_code}")
 
+    orchestration_response = response.json()
+    instance_id = orchestration_response.get('id')
+    logging.info(f"[DURABLE-START] Successfully started orchestration: {instance_id}")
+    logging.info(f"[DURABLE-START] Orchestration response: {orchestration_response}")
+    return instance_id
 
-from .errors import ValidationError
+
+# Fields create_analysis_job requires from DurableOrchestrator's initial response
+_REQUIRED_WORKFLOW_FIELDS = frozenset({"status", "research_calls_made", "synthesis_calls_made"})
+
+
+class _PendingRow:
+    """Row waiting in a _RowAppendBatcher, with its completion signal."""
+
+    def __init__(self, row: List[Any]):
+        self.row = row
+        self.done = threading.Event()
+        self.error = None
+
+
+class _RowAppendBatcher:
+    """Group-commits rows appended concurrently to the same worksheet.
+
+    The first caller flushes immediately; rows queued while that flush is in
+    flight are written together with a single append_rows call. Every caller
+    blocks until its own row has been written, so failures still surface to
+    the request that produced the row.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: List[_PendingRow] = []
+        self._flushing = False
+
+    def append(self, worksheet, row: List[Any]) -> None:
+        entry = _PendingRow(row)
+        with self._lock:
+            self._pending.append(entry)
+            is_leader = not self._flushing
+            self._flushing = True
+
+        if is_leader:
+            self._flush(worksheet)
+
+        entry.done.wait()
+        if entry.error is not None:
+            raise entry.error
+
+    def _flush(self, worksheet) -> None:
+        while True:
+            with self._lock:
+                batch, self._pending = self._pending, []
+                if not batch:
+                    self._flushing = False
+                    return
+
+            error = None
+            try:
+                worksheet.append_rows([entry.row for entry in batch])
+                if len(batch) > 1:
+                    logging.info(f"Appended {len(batch)} queued rows in one batch")
+            except Exception as e:
+                error = e
+
+            for entry in batch:
+                entry.error = error
+                entry.done.set()
+
+
+# Opened spreadsheets by ID; opening one costs a Sheets API round trip
+_SPREADSHEETS: Dict[str, Any] = {}
+_SPREADSHEETS_LOCK = threading.Lock()
+
+
+_ROW_BATCHERS: Dict[str, _RowAppendBatcher] = {}
+_ROW_BATCHERS_LOCK = threading.Lock()
+
+
+def _get_row_batcher(spreadsheet_id: str) -> _RowAppendBatcher:
+    """Get the shared row batcher for a spreadsheet."""
+    with _ROW_BATCHERS_LOCK:
+        batcher = _ROW_BATCHERS.get(spreadsheet_id)
+        if batcher is None:
+            batcher = _ROW_BATCHERS[spreadsheet_id] = _RowAppendBatcher()
+        return batcher
 
 
 class AnalysisService:
@@ -35,13 +408,14 @@ class AnalysisService:
         self._openai_client = None
         self._sheets_client = None
         self._spreadsheet = None
+        self._worksheet = None
         self._agent_config = None
 
     @property
     def openai_client(self):
-        """Lazy-initialized OpenAI client."""
+        """Lazy-initialized OpenAI client, shared process-wide."""
         if self._openai_client is None:
-            self._openai_client = get_openai_client()
+            self._openai_client = get_shared_openai_client()
         return self._openai_client
 
     @property
@@ -53,49 +427,46 @@ class AnalysisService:
 
     @property
     def spreadsheet(self):
-        """Lazy-initialized spreadsheet object."""
+        """Lazy-initialized spreadsheet object, shared across service instances."""
         if self._spreadsheet is None:
-            self._spreadsheet = get_spreadsheet(self.spreadsheet_id, self.sheets_client)
+            self._spreadsheet = _SPREADSHEETS.get(self.spreadsheet_id)
+            if self._spreadsheet is None:
+                with _SPREADSHEETS_LOCK:
+                    if self.spreadsheet_id not in _SPREADSHEETS:
+                        _SPREADSHEETS[self.spreadsheet_id] = get_spreadsheet(
+                            self.spreadsheet_id, self.sheets_client
+                        )
+                    self._spreadsheet = _SPREADSHEETS[self.spreadsheet_id]
         return self._spreadsheet
 
+    @property
+    def worksheet(self):
+        """Lazy-initialized first worksheet holding job records."""
+        if self._worksheet is None:
+            self._worksheet = self.spreadsheet.get_worksheet(0)
+        return self._worksheet
+
     @property
     def agent_config(self) -> FullAgentConfig:
-        """Lazy-initialized agent configuration from YAML + Google Sheets."""
+        """Lazy-initialized agent configuration from YAML + Google Sheets.
+
+        Built configs are shared across service instances until the YAML file
+        changes or the entry is older than _AGENT_CONFIG_TTL_SECONDS.
+        """
         if self._agent_config is None:
-            # Find project root - try multiple strategies for different environments
-            current_path = Path(__file__).resolve()
-            project_root = None
-
-            # Strategy 1: Look for pyproject.toml (local development)
-            for parent in current_path.parents:
-                if (parent / 'pyproject.toml').exists():
-                    project_root = parent
-                    break
-
-            # Strategy 2: Look for agents/ directory (Azure Functions deployment)
-            if project_root is None:
-                for parent in current_path.parents:
-                    if (parent / 'agents' / 'business_evaluation.yaml').exists():
-                        project_root = parent
-                        break
-
-            # Strategy 3: Assume agents/ is at same level as current directory structure
-            if project_root is None:
-                # In Azure Functions, common/ and agents/ are typically siblings
-                common_parent = current_path.parent.parent  # Go up from common/
-                if (common_parent / 'agents' / 'business_evaluation.yaml').exists():
-                    project_root = common_parent
-
-            if project_root is None:
-                raise ValueError(
-                    "Could not find project root or agents/business_evaluation.yaml file"
-                )
+            yaml_path = _find_yaml_path()
+            cache_key = (str(yaml_path), yaml_path.stat().st_mtime_ns)
+            now = time.monotonic()
 
-            yaml_path = project_root / 'agents' / 'business_evaluation.yaml'
-            agent_def = AgentDefinition.from_yaml(yaml_path)
-            self._agent_config = FullAgentConfig.from_definition(
-                agent_def, self.sheets_client
-            )
+            cached = _AGENT_CONFIG_CACHE.get(cache_key)
+            if cached is not None and now - cached[1] < _AGENT_CONFIG_TTL_SECONDS:
+                self._agent_config = cached[0]
+            else:
+                agent_def = AgentDefinition.from_yaml(yaml_path)
+                self._agent_config = FullAgentConfig.from_definition(
+                    agent_def, self.sheets_client
+                )
+                _AGENT_CONFIG_CACHE[cache_key] = (self._agent_config, now)
         return self._agent_config
 
     def validate_user_input(self, user_input: Dict[str, Any]) -> None:
@@ -110,13 +481,10 @@ class AnalysisService:
         if not user_input:
             raise ValidationError("user_input is required")
 
-        required_fields = [
-            field.name for field in self.agent_config.schema.input_fields
-        ]
         missing_fields = [
             field
-            for field in required_fields
-            if field not in user_input or not str(user_input[field]).strip()
+            for field in self.agent_config.input_field_names
+            if field not in user_input or not _has_value(user_input[field])
         ]
 
         if missing_fields:
@@ -131,37 +499,35 @@ class AnalysisService:
             Budget options with pricing details
         """
 
-        # Generate pricing options from universal budget configuration
-        pricepoints = []
-        for tier in self.agent_config.get_budget_tiers():
-            calculated_price = tier.calculate_price(self.agent_config)
-            pricepoints.append(
-                {
-                    "level": tier.name,
-                    "name": f"{tier.name.title()} Analysis",
-                    "max_cost": calculated_price,
-                    "estimated_cost": calculated_price,
-                    "model": self.agent_config.get_model(
-                        'research'
-                    ),  # Use unified model resolution
-                    "description": tier.description,
-                    "deliverables": tier.deliverables,
-                    "time_estimate": getattr(
-                        tier,
-                        'time_estimate',
-                        f"{(1 + tier.num_research_calls + 1) * 5}-{(1 + tier.num_research_calls + 1) * 10} minutes",
-                    ),
-                }
-            )
+        config = self.agent_config
+        pricepoints = _copy_pricepoints(_get_pricepoints(config))
 
         return {
-            "agent_type": self.agent_config.definition.agent_id,
+            "agent_type": config.definition.agent_id,
             "pricepoints": pricepoints,
-            "message": "Select a budget tier and call /api/execute_analysis to start the analysis",
+            "message": _BUDGET_OPTIONS_MESSAGE,
             "next_endpoint": "/api/execute_analysis",
-            "timestamp": datetime.datetime.now().isoformat(),
+            "timestamp": _iso_now(),
         }
 
+    def get_budget_options_json(self, **extra: Any) -> bytes:
+        """Get budget options as a serialized JSON body.
+
+        Same content as get_budget_options(), but the static part is serialized
+        once per agent config and only the timestamp (plus any extra fields) is
+        encoded per request.
+
+        Args:
+            **extra: Additional top-level fields to include in the response
+
+        Returns:
+            UTF-8 encoded JSON object
+        """
+        body = _get_budget_options_prefix(self.agent_config) + b',"timestamp":"' + _iso_now().encode()
+        if extra:
+            return body + b'",' + orjson.dumps(extra)[1:]
+        return body + b'"}'
+
     def _generate_job_fingerprint(self, user_input: Dict[str, Any], budget_tier: str) -> str:
         """Generate deterministic fingerprint for request deduplication.
         
@@ -169,11 +535,15 @@ class AnalysisService:
             user_input: User's input data
             budget_tier: Selected budget tier
             
+        Text values are compared case- and whitespace-insensitively, so a
+        resubmission that only differs in spacing or capitalisation reuses the
+        earlier job (and its results) instead of paying for a new analysis.
+        
         Returns:
             16-character hex fingerprint for job identification
         """
         fingerprint_data = {
-            "user_input": user_input,
+            "user_input": _normalize_fingerprint_input(user_input),
             "budget_tier": budget_tier,
             "agent_id": self.agent_config.definition.agent_id,
             "spreadsheet_id": self.spreadsheet_id
@@ -191,16 +561,19 @@ class AnalysisService:
             Existing job data if found, None otherwise
         """
         try:
-            worksheet = self.spreadsheet.get_worksheet(0)
+            worksheet = self.worksheet
+
+            # Skip the full-sheet search when the filter rules the job out
+            fp_filter = _get_fingerprint_filter(self.spreadsheet_id, worksheet)
+            if fp_filter is not None and f"fp_{job_fingerprint}" not in fp_filter:
+                return None
             
             # Look for existing job with same fingerprint
             try:
-                cell = worksheet.find(f"fp_{job_fingerprint}")
+                # Job IDs live in column A, so the matched cell already holds the job_id
+                cell = worksheet.find(f"fp_{job_fingerprint}", in_column=1)
                 if cell:
-                    row_num = cell.row
-                    # Get the actual job_id from the same row (column A should contain the real job_id)
-                    job_id_cell = worksheet.cell(row_num, 1)
-                    existing_job_id = job_id_cell.value
+                    existing_job_id = cell.value
                     
                     logging.info(f"Found existing job with fingerprint {job_fingerprint}: {existing_job_id}")
                     
@@ -249,18 +622,8 @@ class AnalysisService:
             logging.info(f"Returning existing job {existing_job['job_id']} to prevent duplicate")
             return existing_job
 
-        # Find selected tier configuration from universal budget config
-        tier_config = None
-        for tier in self.agent_config.get_budget_tiers():
-            if tier.name == budget_tier:
-                tier_config = tier
-                break
-
-        if tier_config is None:
-            available_tiers = [t.name for t in self.agent_config.get_budget_tiers()]
-            raise ValidationError(
-                f"Invalid budget tier '{budget_tier}'. Available: {available_tiers}"
-            )
+        # Reject unknown tiers before any API work (raises ValidationError)
+        self.agent_config.get_budget_tier(budget_tier)
 
         # Check for testing mode
         if is_testing_mode():
@@ -282,7 +645,7 @@ class AnalysisService:
         logging.info(f"Created DurableOrchestrator job with fast return: {analysis_job_id}")
 
         # Create initial spreadsheet record with research plan only
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
 
         try:
             # Create record with research plan, no final results yet
@@ -296,46 +659,27 @@ class AnalysisService:
         # Start Durable Functions orchestration for reliable background processing
         logging.info(f"=== STARTING DURABLE FUNCTIONS ORCHESTRATION FOR JOB {analysis_job_id} ===")
         
+        # Prepare orchestration input data with instance ID for deduplication
+        orchestration_input = {
+            "job_id": analysis_job_id,
+            "user_input": user_input,
+            "budget_tier": budget_tier,
+            "spreadsheet_id": self.spreadsheet_id,
+            "research_plan": research_plan,
+            "instance_id": analysis_job_id  # Use deterministic job ID as instance ID for deduplication
+        }
+
+        # Get orchestrator endpoint - use production Azure Functions URL by default
+        base_url = os.environ.get('AZURE_FUNCTIONS_BASE_URL', 'http://localhost:7071')
+        orchestrator_url = f"{base_url}/api/orchestrator"
+
         try:
-            # Prepare orchestration input data with instance ID for deduplication
-            orchestration_input = {
-                "job_id": analysis_job_id,
-                "user_input": user_input,
-                "budget_tier": budget_tier,
-                "spreadsheet_id": self.spreadsheet_id,
-                "research_plan": research_plan,
-                "instance_id": analysis_job_id  # Use deterministic job ID as instance ID for deduplication
-            }
-            
-            # Start the durable orchestration using HTTP client
-            
-            # Get orchestrator endpoint - use production Azure Functions URL by default
-            base_url = os.environ.get('AZURE_FUNCTIONS_BASE_URL', 'http://localhost:7071')
-            orchestrator_url = f"{base_url}/api/orchestrator"
-            
-            logging.info(f"[DURABLE-START] Calling orchestrator at: {orchestrator_url}")
-            logging.info(f"[DURABLE-START] Orchestration input: {orchestration_input}")
-            
-            # Make async HTTP call to start orchestration
-            response = requests.post(
-                orchestrator_url,
-                json=orchestration_input,
-                timeout=30  # 30 second timeout for starting orchestration
-            )
-            
-            if response.status_code in [200, 202]:
-                orchestration_response = response.json()
-                instance_id = orchestration_response.get('id')
-                logging.info(f"[DURABLE-START] Successfully started orchestration: {instance_id}")
-                logging.info(f"[DURABLE-START] Orchestration response: {orchestration_response}")
-            else:
-                logging.error(f"[DURABLE-START] Failed to start orchestration: HTTP {response.status_code}")
-                logging.error(f"[DURABLE-START] Response body: {response.text}")
-                # Don't fail the request - just log the error and continue with fast return
-                
-        except Exception as e:
-            logging.error(f"[DURABLE-START] Exception starting orchestration: {str(e)}")
-            # Don't fail the request - just log the error and continue with fast return
+            _start_orchestration(orchestrator_url, orchestration_input)
+        except AnalysisError:
+            # Without an orchestration the row would be a dead job that
+            # duplicate detection keeps returning; retire it so a retry can start fresh
+            self._mark_start_failed(analysis_job_id)
+            raise
             
         logging.info(f"=== RETURNING QUICK RESPONSE TO AVOID CUSTOM GPT TIMEOUT ===")
         
@@ -343,12 +687,9 @@ class AnalysisService:
         workflow_result = initial_result
 
         # Validate workflow result has required fields instead of using silent defaults
-        if "status" not in workflow_result:
-            raise RuntimeError("Workflow result missing required 'status' field - indicates DurableOrchestrator malfunction")
-        if "research_calls_made" not in workflow_result:
-            raise RuntimeError("Workflow result missing required 'research_calls_made' field - indicates DurableOrchestrator malfunction")
-        if "synthesis_calls_made" not in workflow_result:
-            raise RuntimeError("Workflow result missing required 'synthesis_calls_made' field - indicates DurableOrchestrator malfunction")
+        missing_fields = _REQUIRED_WORKFLOW_FIELDS - workflow_result.keys()
+        if missing_fields:
+            raise RuntimeError(f"Workflow result missing required fields {sorted(missing_fields)} - indicates DurableOrchestrator malfunction")
         
         return {
             "job_id": analysis_job_id,
@@ -360,9 +701,24 @@ class AnalysisService:
             "research_plan": research_plan,
             "message": f"Analysis started with {budget_tier} tier. Durable Functions orchestration in progress - results will be available via job_id",
             "next_endpoint": f"/api/summarize_idea?id={analysis_job_id}",
-            "timestamp": datetime.datetime.now().isoformat(),
+            "timestamp": _iso_now(),
         }
 
+    def _mark_start_failed(self, job_id: str) -> None:
+        """Rename a job's row ID so duplicate detection no longer matches it.
+
+        Args:
+            job_id: Job whose orchestration failed to start
+        """
+        try:
+            worksheet = self.worksheet
+            cell = worksheet.find(job_id, in_column=1)
+            if cell:
+                worksheet.update_cell(cell.row, 1, f"start_failed_{job_id}")
+                logging.info(f"Marked job {job_id} as failed to start")
+        except Exception as e:
+            logging.error(f"Failed to mark job {job_id} as failed to start: {str(e)}")
+
     def _create_spreadsheet_record(
         self, job_id: str, timestamp: str, user_input: Dict[str, Any], research_plan: Dict[str, Any] = None, final_result: Dict[str, Any] = None
     ) -> None:
@@ -377,34 +733,39 @@ class AnalysisService:
         """
         try:
             logging.info(f"Getting spreadsheet worksheet for job {job_id}")
-            worksheet = self.spreadsheet.get_worksheet(0)
+            worksheet = self.worksheet
             logging.info(f"Got worksheet, creating row data for job {job_id}")
 
-            # Create row with job ID, timestamp, research plan, and input data
-            row_data = [job_id, timestamp]
-            logging.info(f"Base row data created: {row_data[:2]}")
-            
-            # Add research plan as third column (JSON string)
-            if research_plan:
-                import json
-                research_plan_str = json.dumps(research_plan, separators=(',', ':'))
-                row_data.append(research_plan_str)
-            else:
-                row_data.append("")
+            agent_config = self.agent_config
 
-            # Add input column values in dynamic schema order
-            for field in self.agent_config.schema.input_fields:
-                row_data.append(user_input.get(field.name, ""))
-
-            # Add output column values from final results (if available)
-            for field in self.agent_config.schema.output_fields:
-                if final_result:
-                    value = final_result.get(field.name, "")
-                    row_data.append(str(value))
-                else:
-                    row_data.append("")  # Empty if no final result yet
+            # Research plan is stored as a compact JSON string in the third column
+            research_plan_str = (
+                json.dumps(research_plan, separators=(',', ':')) if research_plan else ""
+            )
 
-            worksheet.append_row(row_data)
+            # Output columns stay empty until final results are available
+            if final_result:
+                output_values = [
+                    str(final_result.get(name, "")) for name in agent_config.output_field_names
+                ]
+            else:
+                output_values = agent_config.empty_output_values
+
+            # Job ID, timestamp, research plan, then input and output columns in schema order
+            row_data = [
+                job_id,
+                timestamp,
+                research_plan_str,
+                *[user_input.get(name, "") for name in agent_config.input_field_names],
+                *output_values,
+            ]
+
+            # SHEETS_SYNC_APPEND=true writes each row on its own for debugging
+            if os.getenv("SHEETS_SYNC_APPEND", "false").lower() == "true":
+                worksheet.append_row(row_data)
+            else:
+                _get_row_batcher(self.spreadsheet_id).append(worksheet, row_data)
+            _remember_job_id(self.spreadsheet_id, job_id)
 
         except Exception as e:
             logging.error(f"Error creating spreadsheet record: {str(e)}")
@@ -420,10 +781,10 @@ class AnalysisService:
             final_result: Final analysis results to add to output columns
         """
         try:
-            worksheet = self.spreadsheet.get_worksheet(0)
+            worksheet = self.worksheet
             
             # Find the row with this job_id (in column A)
-            cell = worksheet.find(job_id)
+            cell = worksheet.find(job_id, in_column=1)
             if not cell:
                 logging.error(f"Could not find spreadsheet row for job_id: {job_id}")
                 return
@@ -431,49 +792,34 @@ class AnalysisService:
             row_num = cell.row
             logging.info(f"Updating spreadsheet row {row_num} with final results for job: {job_id}")
             
+            agent_config = self.agent_config
+
             # Calculate where output columns start
-            input_fields_count = len(self.agent_config.schema.input_fields)
+            input_fields_count = len(agent_config.input_field_names)
             output_start_col = 3 + input_fields_count + 1  # +1 because gspread is 1-indexed
             
-            # Update each output field column with final results
-            for i, field in enumerate(self.agent_config.schema.output_fields):
-                col_num = output_start_col + i
-                value = final_result.get(field.name, "")
-                worksheet.update_cell(row_num, col_num, str(value))
+            output_names = agent_config.output_field_names
+            if not output_names:
+                return
+
+            # Write all output columns with one values.update instead of one request per cell
+            output_range = "{}:{}".format(
+                rowcol_to_a1(row_num, output_start_col),
+                rowcol_to_a1(row_num, output_start_col + len(output_names) - 1),
+            )
+            worksheet.update(
+                values=[[str(final_result.get(name, "")) for name in output_names]],
+                range_name=output_range,
+                value_input_option=ValueInputOption.user_entered,
+            )
                 
-            logging.info(f"Successfully updated {len(self.agent_config.schema.output_fields)} output fields for job: {job_id}")
+            logging.info(f"Successfully updated {len(agent_config.output_field_names)} output fields for job: {job_id}")
             
         except Exception as e:
             logging.error(f"Error updating spreadsheet record for job {job_id}: {str(e)}")
             # Don't raise exception here since this is background processing
 
 
-    def _estimate_usage_for_tier(self, tier_config: BudgetTierConfig) -> Dict[str, Any]:
-        """Estimate token usage based on tier configuration.
-
-        All tiers use o4-mini-deep-research with multi-call architecture.
-        Usage scales with number of calls available.
-
-        Args:
-            tier_config: Budget tier configuration
-
-        Returns:
-            Estimated usage data with prompt_tokens, completion_tokens, total_tokens
-        """
-        # Base estimate per call for o4-mini-deep-research
-        prompt_tokens_per_call = 2500
-        completion_tokens_per_call = 4000
-
-        # Scale by number of calls in the tier
-        total_prompt_tokens = prompt_tokens_per_call * tier_config.call_count
-        total_completion_tokens = completion_tokens_per_call * tier_config.call_count
-
-        return {
-            "prompt_tokens": total_prompt_tokens,
-            "completion_tokens": total_completion_tokens,
-            "total_tokens": total_prompt_tokens + total_completion_tokens,
-        }
-
     def _create_mock_job(
         self, user_input: Dict[str, Any], budget_tier: str
     ) -> Dict[str, Any]:
@@ -486,7 +832,7 @@ class AnalysisService:
         Returns:
             Mock job creation response
         """
-        mock_job_id = f"mock_{uuid.uuid4()}"
+        mock_job_id = f"mock_{secrets.token_hex(16)}"
 
         logging.info(f"Created mock job {mock_job_id} for testing (no API charges)")
 
@@ -498,7 +844,24 @@ class AnalysisService:
             "spreadsheet_record_id": mock_job_id,
             "message": f"[TESTING MODE] Mock analysis started with {budget_tier} tier. No API charges incurred.",
             "next_endpoint": f"/api/process_idea?id={mock_job_id}",
-            "timestamp": datetime.datetime.now().isoformat(),
+            "timestamp": _iso_now(),
             "testing_mode": True,
             "note": "This is a mock job for testing purposes - no actual analysis will be performed",
         }
+
+
+def _prewarm_agent_config() -> None:
+    """Load agent configuration at import so the first request after a cold start doesn't pay for it.
+
+    Only local files are read (the agent YAML and platform.yaml). Nothing here
+    may touch Sheets or OpenAI, or call is_testing_mode(), whose cached value
+    must not be fixed before the environment is fully set up.
+    """
+    try:
+        AgentDefinition.from_yaml(_find_yaml_path())
+        prompt_manager._load_common_config()
+    except Exception as e:
+        logging.warning(f"Agent config prewarm failed, will load on first request: {e}")
+
+
+_prewarm_agent_config()
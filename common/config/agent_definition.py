@@ -2,19 +2,35 @@
 Agent definition loader for YAML configuration files.
 """
 
-import re
+import os
+import string
 import yaml
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, Iterable, List, Tuple, Union
 from .models import AgentDefinition
 
 
 from ..errors import ValidationError
 
+# libyaml's C loader when PyYAML was built with it, else the pure-Python one
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+
+# Parsed definitions keyed by (path, mtime_ns, size); editing the file invalidates its entry
+_YAML_CACHE: Dict[Tuple[str, int, int], AgentDefinition] = {}
+
+
+# Translation table that deletes every URL-safe character; anything left over is invalid
+_AGENT_ID_STRIP = str.maketrans("", "", string.ascii_letters + string.digits + "_-")
+
 
 def _validate_agent_id(agent_id: str) -> None:
     """Validate that agent_id is URL-safe."""
-    if not re.match(r'^[a-zA-Z0-9_-]+$', agent_id):
+    if not isinstance(agent_id, str) or not agent_id or agent_id.translate(_AGENT_ID_STRIP):
         raise ValidationError("agent_id must be URL-safe (alphanumeric, underscores, hyphens only)")
 
 
@@ -25,30 +41,31 @@ def _validate_required_fields(data: dict, required_fields: List[str]) -> None:
         raise ValidationError(f"Missing required field(s): {', '.join(missing)}")
 
 
-def load_agent_definition(yaml_path: Path) -> AgentDefinition:
-    """
-    Load agent definition from YAML file.
-    
-    Args:
-        yaml_path: Path to YAML configuration file
-        
-    Returns:
-        AgentDefinition instance
-        
-    Raises:
-        ValidationError: If YAML format is invalid or missing required fields
-    """
-    if not yaml_path.exists():
+def _cache_key(yaml_path: Path) -> Tuple[str, int, int]:
+    """Get the _YAML_CACHE key for a file, which changes whenever the file is edited."""
+    try:
+        stat = yaml_path.stat()
+    except FileNotFoundError:
         raise ValidationError(f"Agent definition file not found: {yaml_path}")
-    
+    return (str(yaml_path), stat.st_mtime_ns, stat.st_size)
+
+
+def _read_agent_yaml(yaml_path: Path) -> dict:
+    """Read and parse an agent YAML file into a plain dict.
+
+    Module-level and dict-returning so it can run in a worker process.
+    """
     try:
-        with open(yaml_path, 'r') as f:
-            data = yaml.safe_load(f)
+        with open(yaml_path, 'rb') as f:
+            return yaml.load(f, Loader=_SafeLoader)
     except yaml.YAMLError as e:
         raise ValidationError(f"Invalid YAML syntax: {str(e)}")
     except Exception as e:
         raise ValidationError(f"Cannot read file {yaml_path}: {str(e)}")
-    
+
+
+def _build_agent_definition(data: Any) -> AgentDefinition:
+    """Validate parsed YAML data and build the AgentDefinition."""
     if not isinstance(data, dict):
         raise ValidationError("YAML file must contain a dictionary")
     
@@ -61,3 +78,60 @@ def load_agent_definition(yaml_path: Path) -> AgentDefinition:
     
     # Budget tier validation happens in AgentDefinition.from_dict()
     return AgentDefinition.from_dict(data)
+
+
+def load_agent_definition(yaml_path: Path) -> AgentDefinition:
+    """
+    Load agent definition from YAML file.
+    
+    Args:
+        yaml_path: Path to YAML configuration file
+        
+    Returns:
+        AgentDefinition instance
+        
+    Raises:
+        ValidationError: If YAML format is invalid or missing required fields
+    """
+    cache_key = _cache_key(yaml_path)
+    cached = _YAML_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    definition = _build_agent_definition(_read_agent_yaml(yaml_path))
+    _YAML_CACHE[cache_key] = definition
+    return definition
+
+
+def load_agent_definitions(yaml_paths: Iterable[Union[str, Path]]) -> List[AgentDefinition]:
+    """
+    Load several agent definitions, parsing uncached files in parallel processes.
+    
+    YAML parsing is CPU-bound, so files are parsed in a process pool when
+    more than one needs parsing; workers return plain dicts and the
+    definitions are validated and built in this process.
+    
+    Args:
+        yaml_paths: Paths to YAML configuration files
+        
+    Returns:
+        AgentDefinition instances in the same order as yaml_paths
+        
+    Raises:
+        ValidationError: If any file is missing, invalid, or missing required fields
+    """
+    paths = [Path(path) for path in yaml_paths]
+    cache_keys = [_cache_key(path) for path in paths]
+    to_parse = [i for i, key in enumerate(cache_keys) if key not in _YAML_CACHE]
+    
+    if len(to_parse) > 1:
+        workers = min(len(to_parse), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parsed = list(executor.map(_read_agent_yaml, [paths[i] for i in to_parse]))
+    else:
+        parsed = [_read_agent_yaml(paths[i]) for i in to_parse]
+    
+    for i, data in zip(to_parse, parsed):
+        _YAML_CACHE[cache_keys[i]] = _build_agent_definition(data)
+    
+    return [_YAML_CACHE[key] for key in cache_keys]
@@ -2,97 +2,130 @@
 Data models for the Universal AI Agent Platform configuration system.
 """
 
-from dataclasses import dataclass
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import List, Dict, Any, FrozenSet, NamedTuple, Optional, Tuple
 import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from common import get_google_sheets_client
+from common.http_utils import is_testing_mode
+from common.prompt_manager import prompt_manager
 from ..errors import ValidationError
 
 
-@dataclass
-class FieldConfig:
-    """Individual field definition from Google Sheet schema."""
+_FIELD_TYPES = frozenset({"user input", "bot output", "ID", "Time", "system"})
+
 
+class _FieldConfigFields(NamedTuple):
     name: str  # Row 3: Column name (e.g., "Idea_Overview")
     type: str  # Row 1: "user input" or "bot output"
     description: str  # Row 2: Field description for prompts
     column_index: int  # Which column in sheet
 
-    def __post_init__(self):
+
+class FieldConfig(_FieldConfigFields):
+    """Individual field definition from Google Sheet schema.
+
+    An immutable named tuple: fields are built once per schema load and only read.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, name: str, type: str, description: str, column_index: int):
         """Validate field configuration."""
-        if self.type not in ["user input", "bot output", "ID", "Time", "system"]:
-            raise ValueError(f"Invalid field type '{self.type}'. Must be one of: user input, bot output, ID, Time, system")
+        if type not in _FIELD_TYPES:
+            raise ValueError(f"Invalid field type '{type}'. Must be one of: user input, bot output, ID, Time, system")
+        # Names are reused as dict keys for every request; interned keys match by identity
+        return super().__new__(cls, sys.intern(name), sys.intern(type), description, column_index)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SheetSchema:
-    """Dynamic schema parsed from Google Sheet rows 1-3."""
+    """Dynamic schema parsed from Google Sheet rows 1-3.
+
+    Field-derived names are computed once at construction; the schema is
+    immutable so they can't go stale.
+    """
 
     input_fields: List[FieldConfig]  # Fields user must provide
     output_fields: List[FieldConfig]  # Fields agent will generate
+    _required_fields: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _header_row: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _output_headers: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Precompute field name lookups."""
+        input_names = tuple(f.name for f in self.input_fields)
+        output_names = tuple(f.name for f in self.output_fields)
+        object.__setattr__(self, "_required_fields", frozenset(input_names))
+        object.__setattr__(self, "_header_row", ("ID", "Time", *input_names, *output_names))
+        object.__setattr__(self, "_output_headers", output_names)
 
     def validate_input(self, user_input: Dict[str, Any]) -> bool:
         """Validate that user input contains all required fields."""
-        required_fields = {field.name for field in self.input_fields}
-        provided_fields = set(user_input.keys())
-        return required_fields.issubset(provided_fields)
+        return user_input.keys() >= self._required_fields
 
     def get_header_row(self) -> List[str]:
         """Generate header row for Google Sheets."""
-        headers = ["ID", "Time"]  # Standard columns
+        return list(self._header_row)
 
-        # Add input fields
-        for field in self.input_fields:
-            headers.append(field.name)
+    def generate_output_headers(self) -> List[str]:
+        """Get output field names in order."""
+        return list(self._output_headers)
 
-        # Add output fields
-        for field in self.output_fields:
-            headers.append(field.name)
 
-        return headers
+# Model costs per call, used for tier pricing
+_MODEL_COSTS: Dict[str, float] = {
+    "o4-mini": 0.25,
+    "o4-mini-deep-research": 1.00,
+    "gpt-4o-mini": 0.05,
+}
 
-    def generate_output_headers(self) -> List[str]:
-        """Get output field names in order."""
-        return [field.name for field in self.output_fields]
 
+# Deliverables lists are usually identical across tiers; equal tuples share one object
+_SHARED_DELIVERABLES: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class BudgetTierConfig:
-    """Budget tier configuration for agent."""
+    """Budget tier configuration for agent.
+
+    Immutable: tiers are parsed once and shared by every caller of a config.
+    """
 
     name: str  # "basic", "standard", "premium"
     num_research_calls: int  # Number of research calls (planning/synthesis always 1 each)
     description: str  # Human-readable description
-    deliverables: List[str] = None  # Optional list of deliverables
+    deliverables: Tuple[str, ...] = ()  # Optional deliverables
 
     def __post_init__(self):
         """Validate budget tier configuration."""
-        if self.deliverables is None:
-            self.deliverables = []
+        deliverables = tuple(self.deliverables or ())
+        object.__setattr__(self, "deliverables", _SHARED_DELIVERABLES.setdefault(deliverables, deliverables))
         if self.num_research_calls < 0:
             raise ValueError("Number of research calls must be non-negative")
         if not self.name or not self.name.strip():
             raise ValueError("Name cannot be empty")
         if not self.description or len(self.description.strip()) < 10:
             raise ValueError("Description must be at least 10 characters")
+        object.__setattr__(self, "name", sys.intern(self.name))
 
     def calculate_price(self, agent_config: 'FullAgentConfig') -> float:
         """Calculate dynamic price based on model costs and call structure."""
-        # Model costs per call
-        model_costs = {
-            "o4-mini": 0.25,
-            "o4-mini-deep-research": 1.00,
-            "gpt-4o-mini": 0.05
-        }
-        
         # Get models from agent config
         planning_model = agent_config.get_model('planning')
         research_model = agent_config.get_model('research')
         synthesis_model = agent_config.get_model('synthesis')
         
         # Calculate total cost: 1 planning + N research + 1 synthesis
-        planning_cost = model_costs.get(planning_model, 0.25)
-        research_cost = model_costs.get(research_model, 1.00) * self.num_research_calls
-        synthesis_cost = model_costs.get(synthesis_model, 0.25)
+        planning_cost = _MODEL_COSTS.get(planning_model, 0.25)
+        research_cost = _MODEL_COSTS.get(research_model, 1.00) * self.num_research_calls
+        synthesis_cost = _MODEL_COSTS.get(synthesis_model, 0.25)
         
         return planning_cost + research_cost + synthesis_cost
 
@@ -103,11 +136,11 @@ class BudgetTierConfig:
             name=data['name'],
             num_research_calls=int(data['num_research_calls']),
             description=data['description'],
-            deliverables=data.get('deliverables', []),
+            deliverables=data.get('deliverables', ()),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentDefinition:
     """Static agent configuration from YAML file."""
 
@@ -115,29 +148,108 @@ class AgentDefinition:
     name: str  # Human-readable name
     sheet_url: str  # Google Sheet containing schema + data
     starter_prompt: str  # Core agent expertise/personality
-    models: Dict[str, str] = (
-        None  # Optional model overrides (uses platform defaults if None)
-    )
+    models: Dict[str, str] = field(
+        default_factory=dict
+    )  # Optional model overrides (uses platform defaults if empty)
 
     @classmethod
     def from_yaml(cls, yaml_path):
         """Load agent definition from YAML file."""
-        from .agent_definition import load_agent_definition
-
         return load_agent_definition(yaml_path)
 
+    @classmethod
+    def load_many(cls, yaml_paths) -> List['AgentDefinition']:
+        """Load several agent definitions, parsing YAML files in parallel processes."""
+        return load_agent_definitions(yaml_paths)
+
     @classmethod
     def from_dict(cls, data: dict) -> 'AgentDefinition':
         """Create AgentDefinition from dictionary data."""
-        from .agent_definition import ValidationError
-
         return cls(
             agent_id=data['agent_id'],
             name=data['name'],
             sheet_url=data['sheet_url'],
             starter_prompt=data['starter_prompt'],
-            models=data.get('models', {}),
+            models=data.get('models') or {},  # A bare 'models:' key parses as None
+        )
+
+
+# Last parsed platform budget_tiers list and its (tiers, tiers_by_name); configs
+# built from the same platform.yaml load share one set of tier objects
+_parsed_budget_tiers: Tuple[Optional[list], Tuple[BudgetTierConfig, ...], Dict[str, BudgetTierConfig]] = (
+    None, (), {}
+)
+
+
+def _parse_budget_tiers(
+    tier_data: list,
+) -> Tuple[Tuple[BudgetTierConfig, ...], Dict[str, BudgetTierConfig]]:
+    """Parse platform budget tiers, reusing the result for the same source list."""
+    global _parsed_budget_tiers
+
+    source, tiers, tiers_by_name = _parsed_budget_tiers
+    if source is not tier_data:
+        tiers = tuple(BudgetTierConfig.from_dict(data) for data in tier_data)
+        tiers_by_name = {tier.name: tier for tier in tiers}
+        _parsed_budget_tiers = (tier_data, tiers, tiers_by_name)
+    return tiers, tiers_by_name
+
+
+# Parsed sheet schemas keyed by sheet URL: (fetched_at, schema)
+_SCHEMA_CACHE: Dict[str, Tuple[float, SheetSchema]] = {}
+_SCHEMA_CACHE_TTL_SECONDS = 300
+
+
+def _schema_cache_path() -> str:
+    """On-disk schema cache location (SCHEMA_CACHE_PATH, else the temp dir)."""
+    return os.getenv("SCHEMA_CACHE_PATH") or os.path.join(
+        tempfile.gettempdir(), "joey-bot-schema-cache.json"
+    )
+
+
+def _read_schema_cache_file() -> Dict[str, Any]:
+    try:
+        with open(_schema_cache_path(), "rb") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _load_persisted_schema(sheet_url: str, ttl: float) -> Optional[Tuple[float, SheetSchema]]:
+    """Return (age_seconds, schema) for a schema saved by another process within ttl."""
+    entry = _read_schema_cache_file().get(sheet_url)
+    if not isinstance(entry, dict):
+        return None
+    try:
+        age = time.time() - entry["saved_at"]
+        if not 0 <= age < ttl:
+            return None
+        schema = SheetSchema(
+            input_fields=[FieldConfig(*f) for f in entry["input_fields"]],
+            output_fields=[FieldConfig(*f) for f in entry["output_fields"]],
         )
+    except (KeyError, TypeError, ValueError):
+        return None
+    return age, schema
+
+
+def _persist_schema(sheet_url: str, schema: SheetSchema) -> None:
+    """Save a parsed schema so cold starts within the TTL skip the sheet read."""
+    path = _schema_cache_path()
+    data = _read_schema_cache_file()
+    data[sheet_url] = {
+        "saved_at": time.time(),
+        "input_fields": [list(f) for f in schema.input_fields],
+        "output_fields": [list(f) for f in schema.output_fields],
+    }
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logging.warning(f"Could not write schema cache {path}: {e}")
 
 
 @dataclass
@@ -147,6 +259,18 @@ class FullAgentConfig:
     definition: AgentDefinition
     schema: SheetSchema
     universal_config: Dict[str, Any] = None  # Universal prompts, models, budget_tiers
+    _budget_tiers: Optional[Tuple[BudgetTierConfig, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )  # Parsed once from universal_config on first use
+    _budget_tiers_by_name: Optional[Dict[str, BudgetTierConfig]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _instructions: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )  # Rendered user instructions
+    _model_map: Optional[Dict[str, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )  # Resolved model per function type
 
     @property
     def id(self) -> str:
@@ -168,6 +292,21 @@ class FullAgentConfig:
         """Get output field definitions from schema."""
         return self.schema.output_fields
 
+    @cached_property
+    def input_field_names(self) -> Tuple[str, ...]:
+        """Input field names in schema order, computed once per config."""
+        return tuple(field.name for field in self.schema.input_fields)
+
+    @cached_property
+    def output_field_names(self) -> Tuple[str, ...]:
+        """Output field names in schema order, computed once per config."""
+        return tuple(field.name for field in self.schema.output_fields)
+
+    @cached_property
+    def empty_output_values(self) -> Tuple[str, ...]:
+        """Blank values for every output column, used for rows without results yet."""
+        return ("",) * len(self.schema.output_fields)
+
     def validate_input(self, user_input: Dict[str, Any]) -> None:
         """Validate input against schema requirements.
 
@@ -185,13 +324,17 @@ class FullAgentConfig:
             raise ValidationError("Missing required fields")
 
     def generate_instructions(self) -> str:
-        """Generate instructions for the ChatGPT bot on how to collect user input."""
-        from common.prompt_manager import prompt_manager
-        
-        return prompt_manager.format_user_instructions_prompt(
-            agent_name=self.definition.name,
-            input_fields=self.schema.input_fields
-        )
+        """Generate instructions for the ChatGPT bot on how to collect user input.
+
+        Instructions depend only on the agent name and input fields, so they
+        are rendered once per config.
+        """
+        if self._instructions is None:
+            self._instructions = prompt_manager.format_user_instructions_prompt(
+                agent_name=self.definition.name,
+                input_fields=self.schema.input_fields
+            )
+        return self._instructions
 
 
     def get_universal_setting(self, setting_name: str, default: Any = None) -> Any:
@@ -211,10 +354,21 @@ class FullAgentConfig:
         return universal_settings.get(setting_name, default)
 
     def get_model(self, model_type: str) -> str:
-        """Get model for a specific function, with agent overrides."""
-        # Agent-specific override takes precedence
-        if self.definition.models and model_type in self.definition.models:
-            return self.definition.models[model_type]
+        """Get model for a specific function, with agent overrides.
+
+        Platform models and agent overrides are merged into one table on first
+        use; misses fall through to the checks below for a specific error.
+        """
+        if self._model_map is None:
+            platform_config = (self.universal_config or {}).get('platform') or {}
+            self._model_map = {
+                **(platform_config.get('models') or {}),
+                **(self.definition.models or {}),  # Agent-specific override takes precedence
+            }
+        try:
+            return self._model_map[model_type]
+        except KeyError:
+            pass
 
         # Check universal platform model configuration
         if not self.universal_config or 'platform' not in self.universal_config:
@@ -232,42 +386,139 @@ class FullAgentConfig:
         return models[model_type]
 
     def get_budget_tiers(self) -> List[BudgetTierConfig]:
-        """Get universal budget tiers for all agents."""
-        if not self.universal_config or 'platform' not in self.universal_config:
-            raise ValidationError("No platform configuration found - platform.yaml missing or corrupted")
+        """Get universal budget tiers for all agents, parsed once per config."""
+        if self._budget_tiers is None:
+            if not self.universal_config or 'platform' not in self.universal_config:
+                raise ValidationError("No platform configuration found - platform.yaml missing or corrupted")
 
-        platform_config = self.universal_config['platform']
-        if 'budget_tiers' not in platform_config:
-            raise ValidationError("No budget_tiers configuration found in platform.yaml - pricing system requires budget tiers")
-
-        tiers = []
-        for tier_data in platform_config['budget_tiers']:
-            tiers.append(
-                BudgetTierConfig(
-                    name=tier_data['name'],
-                    num_research_calls=int(tier_data['num_research_calls']),
-                    description=tier_data['description'],
-                    deliverables=tier_data.get('deliverables', []),
-                )
+            platform_config = self.universal_config['platform']
+            if 'budget_tiers' not in platform_config:
+                raise ValidationError("No budget_tiers configuration found in platform.yaml - pricing system requires budget tiers")
+
+            self._budget_tiers, self._budget_tiers_by_name = _parse_budget_tiers(
+                platform_config['budget_tiers']
             )
-        return tiers
+        return list(self._budget_tiers)
 
-    @classmethod
-    def from_definition(cls, definition: AgentDefinition, sheets_client=None):
-        """Create FullAgentConfig from definition and sheet URL."""
-        from .sheet_schema_reader import SheetSchemaReader
+    @cached_property
+    def budget_tier_names(self) -> Tuple[str, ...]:
+        """Budget tier names in platform.yaml order, computed once per config."""
+        return tuple(self._budget_tiers_index())
 
-        # Get sheets client if not provided
-        if sheets_client is None:
-            from common import get_google_sheets_client
+    def _budget_tiers_index(self) -> Dict[str, BudgetTierConfig]:
+        """Get the name -> tier index, parsing tiers on first use."""
+        if self._budget_tiers_by_name is None:
+            self.get_budget_tiers()
+        return self._budget_tiers_by_name
 
-            sheets_client = get_google_sheets_client()
+    def get_budget_tier(self, tier_name: str) -> BudgetTierConfig:
+        """Get a single budget tier by name.
 
+        Raises:
+            ValidationError: If no tier has that name
+        """
+        try:
+            return self._budget_tiers_index()[tier_name]
+        except KeyError:
+            raise ValidationError(
+                f"Invalid budget tier '{tier_name}'. Available: {list(self.budget_tier_names)}"
+            ) from None
+
+    @classmethod
+    def from_definition(cls, definition: AgentDefinition, sheets_client=None):
+        """Create FullAgentConfig from definition and sheet URL.
+
+        The sheet schema is reused for schema_cache_ttl seconds (universal
+        setting, default 300) so rebuilding a config doesn't re-read the sheet.
+        Outside testing mode the schema is also saved to disk, so a fresh
+        worker process within the TTL skips the sheet read as well.
+        """
         # Load universal configuration
-        from common.prompt_manager import prompt_manager
+        universal_config = prompt_manager._load_common_config()
+        ttl = _schema_cache_ttl(universal_config)
+        now = time.monotonic()
+        persist = not is_testing_mode()
+
+        schema = _cached_sheet_schema(definition.sheet_url, ttl, now, persist)
+        if schema is None:
+            # Get sheets client if not provided
+            if sheets_client is None:
+                sheets_client = get_google_sheets_client()
+
+            reader = SheetSchemaReader(sheets_client)
+            schema = reader.parse_sheet_schema(definition.sheet_url)
+            _store_sheet_schema(definition.sheet_url, schema, now, persist)
+        return cls(definition, schema, universal_config)
+
+    @classmethod
+    def from_definitions(cls, definitions, sheets_client=None) -> List['FullAgentConfig']:
+        """Create configs for several agents, reading each distinct sheet once.
 
+        Schemas are cached exactly as in from_definition; sheets that aren't
+        cached are read concurrently, one request per distinct sheet URL.
+        """
         universal_config = prompt_manager._load_common_config()
+        ttl = _schema_cache_ttl(universal_config)
+        now = time.monotonic()
+        persist = not is_testing_mode()
+
+        schemas = {}
+        missing = []
+        for definition in definitions:
+            sheet_url = definition.sheet_url
+            if sheet_url in schemas or sheet_url in missing:
+                continue
+            schema = _cached_sheet_schema(sheet_url, ttl, now, persist)
+            if schema is None:
+                missing.append(sheet_url)
+            else:
+                schemas[sheet_url] = schema
+
+        if missing:
+            if sheets_client is None:
+                sheets_client = get_google_sheets_client()
+            reader = SheetSchemaReader(sheets_client)
+            if len(missing) == 1:
+                parsed = [reader.parse_sheet_schema(missing[0])]
+            else:
+                with ThreadPoolExecutor(max_workers=min(len(missing), 8)) as pool:
+                    parsed = list(pool.map(reader.parse_sheet_schema, missing))
+            for sheet_url, schema in zip(missing, parsed):
+                _store_sheet_schema(sheet_url, schema, now, persist)
+                schemas[sheet_url] = schema
+
+        return [cls(definition, schemas[definition.sheet_url], universal_config) for definition in definitions]
+
+
+def _schema_cache_ttl(universal_config: Dict[str, Any]) -> float:
+    return (
+        universal_config.get('platform', {})
+        .get('universal_settings', {})
+        .get('schema_cache_ttl', _SCHEMA_CACHE_TTL_SECONDS)
+    )
 
-        reader = SheetSchemaReader(sheets_client)
-        schema = reader.parse_sheet_schema(definition.sheet_url)
-        return cls(definition, schema, universal_config)
+
+def _cached_sheet_schema(sheet_url: str, ttl: float, now: float, persist: bool) -> Optional[SheetSchema]:
+    """Return a schema from the in-process cache or, when persisting, the disk cache."""
+    cached = _SCHEMA_CACHE.get(sheet_url)
+    if cached is not None and now - cached[0] < ttl:
+        return cached[1]
+
+    if persist:
+        persisted = _load_persisted_schema(sheet_url, ttl)
+        if persisted is not None:
+            age, schema = persisted
+            _SCHEMA_CACHE[sheet_url] = (now - age, schema)
+            return schema
+    return None
+
+
+def _store_sheet_schema(sheet_url: str, schema: SheetSchema, now: float, persist: bool) -> None:
+    _SCHEMA_CACHE[sheet_url] = (now, schema)
+    if persist:
+        _persist_schema(sheet_url, schema)
+
+
+# Imported last because both modules import the models defined above
+from .agent_definition import load_agent_definition, load_agent_definitions  # noqa: E402
+from .sheet_schema_reader import SheetSchemaReader  # noqa: E402
@@ -2,12 +2,21 @@
 Google Sheet schema reader for dynamic agent configuration.
 """
 
+import re
+from itertools import islice, zip_longest
+
 from .models import SheetSchema, FieldConfig
 
 
 from ..errors import SchemaError as SchemaValidationError
 from ..errors import ConfigurationError as SheetAccessError
 
+_SHEET_ID_RE = re.compile(r'/spreadsheets/d/([a-zA-Z0-9-_]+)')
+_BARE_SHEET_ID_RE = re.compile(r'[a-zA-Z0-9_-]{20,}')
+
+# System-managed columns (matched case-insensitively) don't need a field type or description
+_SYSTEM_COLUMNS = frozenset({'id', 'time', 'research_plan'})
+
 
 class SheetSchemaReader:
     """Reads agent configuration schema from Google Sheets rows 1-3."""
@@ -38,12 +47,12 @@ class SheetSchemaReader:
             # Extract sheet ID from URL
             sheet_id = self._extract_sheet_id(sheet_url)
             
-            # Open the spreadsheet using gspread
-            spreadsheet = self.sheets_client.open_by_key(sheet_id)
-            worksheet = spreadsheet.get_worksheet(0)  # Get first worksheet
-            
-            # Get first 3 rows of data
-            sheet_data = worksheet.get_values("A1:Z3")  # Get reasonable range
+            # Read the first 3 rows of the first sheet in one values request,
+            # without opening the spreadsheet or fetching worksheet metadata
+            response = self.sheets_client.http_client.values_get(
+                sheet_id, "A1:Z3", params={"majorDimension": "ROWS"}
+            )
+            sheet_data = response.get("values", [])
             
         except Exception as e:
             raise SheetAccessError(f"Cannot access sheet at {sheet_url}: {str(e)}")
@@ -52,69 +61,63 @@ class SheetSchemaReader:
         if len(sheet_data) < 3:
             raise SchemaValidationError("Sheet must have at least 3 rows for schema definition")
         
-        row1, row2, row3 = sheet_data[0], sheet_data[1], sheet_data[2]
-        
-        # Ensure all rows have same length by padding with empty strings
-        max_length = max(len(row1), len(row2), len(row3))
-        row1.extend([''] * (max_length - len(row1)))
-        row2.extend([''] * (max_length - len(row2)))
-        row3.extend([''] * (max_length - len(row3)))
-        
+        # Only user input and bot output fields belong to the schema; system
+        # columns are checked for duplicates but otherwise skipped
         input_fields = []
         output_fields = []
-        column_names_seen = set()
+        add_input = input_fields.append
+        add_output = output_fields.append
+        seen_names = set()
         
-        # Skip first 2 columns (ID, Time) 
-        for i in range(2, len(row1)):
+        # Walk columns of rows 1-3 together, treating short rows as padded with
+        # empty strings, and skip the first 2 columns (ID, Time)
+        columns = zip_longest(sheet_data[0], sheet_data[1], sheet_data[2], fillvalue='')
+        for i, (raw_type, raw_description, raw_name) in enumerate(islice(columns, 2, None), start=2):
             # Skip empty columns
-            if not row3[i].strip():
+            column_name = raw_name.strip()
+            if not column_name:
                 continue
                 
-            field_type = row1[i].strip().lower()
-            description = row2[i].strip()
-            column_name = row3[i].strip().replace(' ', '_')
-            
-            # Require descriptions for all columns except ID, Time, and Research_Plan (system columns)
-            if not description and column_name.lower() not in ['id', 'time', 'research_plan']:
-                raise SchemaValidationError(f"Empty description for field '{column_name}' in column {i+1}. All fields except ID, Time, and Research_Plan must have descriptions.")
+            description = raw_description.strip()
+            column_name = column_name.replace(' ', '_')
             
             # Handle system columns (ID, Time, Research_Plan) - they don't need User/Bot field types
-            if column_name.lower() in ['id', 'time', 'research_plan']:
-                field_type = "system"  # Special type for system-managed columns
+            if column_name.lower() in _SYSTEM_COLUMNS:
+                add_field = None
             else:
+                # Require descriptions for all columns except ID, Time, and Research_Plan (system columns)
+                if not description:
+                    raise SchemaValidationError(f"Empty description for field '{column_name}' in column {i+1}. All fields except ID, Time, and Research_Plan must have descriptions.")
+                
                 # Normalize and validate field type for regular columns (case insensitive)
+                field_type = raw_type.strip().lower()
                 if field_type == "user":
-                    field_type = "user input"
+                    field_type, add_field = "user input", add_input
                 elif field_type == "bot":
-                    field_type = "bot output"
+                    field_type, add_field = "bot output", add_output
                 else:
-                    raise SchemaValidationError(f"Invalid field type '{row1[i].strip()}' in column {i+1}. Must be 'User' or 'Bot'")
+                    raise SchemaValidationError(f"Invalid field type '{raw_type.strip()}' in column {i+1}. Must be 'User' or 'Bot'")
             
             # Check for duplicate column names
-            if column_name in column_names_seen:
+            if column_name in seen_names:
                 raise SchemaValidationError(f"Duplicate column name '{column_name}' found")
-            column_names_seen.add(column_name)
-            
-            field_config = FieldConfig(
-                name=column_name,
-                type=field_type,
-                description=description,
-                column_index=i
-            )
+            seen_names.add(column_name)
             
-            # Only add user input and bot output fields to schema (exclude system fields)
-            if field_type == "user input":
-                input_fields.append(field_config)
-            elif field_type == "bot output":
-                output_fields.append(field_config)
-            # Skip system fields - they're not part of the input/output schema
+            if add_field is not None:
+                add_field(FieldConfig(
+                    name=column_name,
+                    type=field_type,
+                    description=description,
+                    column_index=i
+                ))
         
         return SheetSchema(input_fields=input_fields, output_fields=output_fields)
     
     def _extract_sheet_id(self, sheet_url: str) -> str:
-        """Extract Google Sheet ID from URL."""
-        import re
-        match = re.search(r'/spreadsheets/d/([a-zA-Z0-9-_]+)', sheet_url)
+        """Extract Google Sheet ID from URL (a bare sheet ID is returned as-is)."""
+        if _BARE_SHEET_ID_RE.fullmatch(sheet_url):
+            return sheet_url
+        match = _SHEET_ID_RE.search(sheet_url)
         if not match:
             raise SchemaValidationError(f"Invalid Google Sheets URL: {sheet_url}")
         return match.group(1)
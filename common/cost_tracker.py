@@ -1,30 +1,26 @@
 """Cost tracking system for OpenAI API calls."""
-import json
+import atexit
 import logging
 import os
+import re
 import threading
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
-from dataclasses import dataclass
+
+import orjson
 
 from common.http_utils import is_testing_mode
 
+# Buffered cost records are flushed every N records, or by a background
+# timer at most T seconds after the first unflushed record
+_FLUSH_EVERY_RECORDS = 20
+_FLUSH_INTERVAL_SECONDS = 5.0
+
+# get_cost_summary results are reused this long while the log is unchanged
+_SUMMARY_CACHE_SECONDS = 30.0
 
-@dataclass
-class APICost:
-    """Represents the cost of an API call."""
-    timestamp: str
-    endpoint: str
-    model: str
-    budget_tier: str
-    job_id: str
-    input_tokens: int
-    output_tokens: int
-    total_tokens: int
-    cost_usd: float
-    user_input_summary: str
-    testing_mode: bool
-    execution_plan: Optional[Dict[str, Any]] = None  # Store multi-call architecture plan
+_TIMESTAMP_RE = re.compile(rb'"timestamp":\s*"([^"]+)"')
 
 
 class CostTracker:
@@ -38,6 +34,13 @@ class CostTracker:
         """
         self.log_file_path = log_file_path
         self._lock = threading.Lock()
+        # Long-lived append handle, opened on first write
+        self._fh = None
+        self._pending_records = 0
+        # Daemon timer that flushes pending records; None when nothing is pending
+        self._flush_timer = None
+        # (cache key, computed_at, summary) for get_cost_summary
+        self._summary_cache = None
     
     def log_api_call(
         self,
@@ -53,6 +56,11 @@ class CostTracker:
     ) -> None:
         """Log an OpenAI API call with cost information.
         
+        Each call appends one JSON line with the keys timestamp, endpoint,
+        model, budget_tier, job_id, tokens (input/output/total), cost_usd,
+        user_input_summary, testing_mode, execution_plan and, when given,
+        additional_context.
+        
         Args:
             endpoint: API endpoint called (e.g., 'execute_analysis')
             model: OpenAI model used (e.g., 'gpt-4o-mini')
@@ -64,38 +72,23 @@ class CostTracker:
             additional_context: Optional extra context
         """
         try:
-            # Create cost record
-            cost_record = APICost(
-                timestamp=datetime.utcnow().isoformat() + "Z",
-                endpoint=endpoint,
-                model=model,
-                budget_tier=budget_tier,
-                job_id=job_id,
-                input_tokens=usage_data.get("prompt_tokens", 0),
-                output_tokens=usage_data.get("completion_tokens", 0),
-                total_tokens=usage_data.get("total_tokens", 0),
-                cost_usd=cost_usd,
-                user_input_summary=self._summarize_user_input(user_input),
-                testing_mode=is_testing_mode(),
-                execution_plan=execution_plan
-            )
-            
-            # Convert to dict for JSON serialization
+            # Build the JSON record directly from the inputs
+            total_tokens = usage_data.get("total_tokens", 0)
             record_dict = {
-                "timestamp": cost_record.timestamp,
-                "endpoint": cost_record.endpoint,
-                "model": cost_record.model,
-                "budget_tier": cost_record.budget_tier,
-                "job_id": cost_record.job_id,
+                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "endpoint": endpoint,
+                "model": model,
+                "budget_tier": budget_tier,
+                "job_id": job_id,
                 "tokens": {
-                    "input": cost_record.input_tokens,
-                    "output": cost_record.output_tokens,
-                    "total": cost_record.total_tokens
+                    "input": usage_data.get("prompt_tokens", 0),
+                    "output": usage_data.get("completion_tokens", 0),
+                    "total": total_tokens
                 },
-                "cost_usd": cost_record.cost_usd,
-                "user_input_summary": cost_record.user_input_summary,
-                "testing_mode": cost_record.testing_mode,
-                "execution_plan": cost_record.execution_plan
+                "cost_usd": cost_usd,
+                "user_input_summary": self._summarize_user_input(user_input),
+                "testing_mode": is_testing_mode(),
+                "execution_plan": execution_plan
             }
             
             # Add additional context if provided
@@ -109,7 +102,7 @@ class CostTracker:
             # Also log to application logger
             logging.info(
                 f"💰 API Cost Logged: {model} | {budget_tier} | ${cost_usd:.4f} | "
-                f"{cost_record.total_tokens} tokens | Job: {job_id[:8]}..."
+                f"{total_tokens} tokens | Job: {job_id[:8]}..."
             )
             
         except Exception as e:
@@ -118,16 +111,60 @@ class CostTracker:
     def _write_cost_record(self, record: Dict[str, Any]) -> None:
         """Thread-safe writing of cost record to file.
         
+        Records go through a buffered handle kept open for the tracker's
+        lifetime; the buffer is flushed every _FLUSH_EVERY_RECORDS records,
+        by a daemon timer _FLUSH_INTERVAL_SECONDS after the first unflushed
+        record, on read and at exit. Call with self._lock held.
+        
         Args:
             record: Cost record dictionary
         """
         # Append as JSON lines format for easy parsing
         try:
-            with open(self.log_file_path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(record) + "\\n")
+            if self._fh is None:
+                self._fh = open(self.log_file_path, "ab", buffering=8192)
+                atexit.register(self.close)
+            self._fh.write(orjson.dumps(
+                record, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+            ))
+            self._pending_records += 1
+            if self._pending_records >= _FLUSH_EVERY_RECORDS:
+                self._flush_locked()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(_FLUSH_INTERVAL_SECONDS, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
         except Exception as e:
             logging.error(f"Failed to write cost record to {self.log_file_path}: {str(e)}")
     
+    def _flush_locked(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if self._fh is not None:
+            self._fh.flush()
+        self._pending_records = 0
+    
+    def flush(self) -> None:
+        """Write any buffered cost records to the log file."""
+        with self._lock:
+            self._flush_locked()
+    
+    def close(self) -> None:
+        """Flush and close the log file handle (reopened on the next write)."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._fh is not None:
+                try:
+                    self._fh.close()
+                except Exception as e:
+                    logging.error(f"Failed to close cost log {self.log_file_path}: {str(e)}")
+                self._fh = None
+                self._pending_records = 0
+            atexit.unregister(self.close)
+    
     def _summarize_user_input(self, user_input: Dict[str, Any]) -> str:
         """Create a brief summary of user input for logging.
         
@@ -138,16 +175,21 @@ class CostTracker:
             Brief summary string
         """
         try:
-            idea = user_input.get("Idea_Overview", "")[:100]  # First 100 chars
-            if len(user_input.get("Idea_Overview", "")) > 100:
-                idea += "..."
-            return idea
+            idea = user_input.get("Idea_Overview", "")
+            summary = idea[:100]  # First 100 chars
+            if len(idea) > 100:
+                summary += "..."
+            return summary
         except Exception:
             return "Unable to summarize user input"
     
     def get_cost_summary(self, days: int = 30) -> Dict[str, Any]:
         """Get cost summary for the last N days.
         
+        Records are appended in time order, so the log is read backwards and
+        the scan stops at the first record older than the cutoff. Summaries
+        are reused for _SUMMARY_CACHE_SECONDS while the log is unchanged.
+        
         Args:
             days: Number of days to look back
             
@@ -155,44 +197,80 @@ class CostTracker:
             Cost summary dictionary
         """
         try:
-            if not os.path.exists(self.log_file_path):
+            self.flush()
+            try:
+                stat = os.stat(self.log_file_path)
+            except FileNotFoundError:
                 return {"total_cost": 0, "call_count": 0, "records": []}
             
-            records = []
+            cache_key = (days, stat.st_mtime_ns, stat.st_size)
+            now = time.monotonic()
+            cached = self._summary_cache
+            if cached is not None and cached[0] == cache_key and now - cached[1] < _SUMMARY_CACHE_SECONDS:
+                return dict(cached[2])
+            
+            recent_records = []
+            record_count = 0
             total_cost = 0.0
             call_count = 0
             
-            # Calculate cutoff date
-            from datetime import datetime, timedelta
-            cutoff_date = datetime.utcnow() - timedelta(days=days)
+            # Calculate cutoff date; ISO-8601 UTC timestamps order the same as
+            # their text, so records are compared as raw bytes without parsing
+            cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat(timespec="seconds").encode()
             
-            with open(self.log_file_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    try:
-                        record = json.loads(line.strip())
-                        record_date = datetime.fromisoformat(record["timestamp"].replace("Z", "+00:00"))
-                        
-                        if record_date >= cutoff_date:
-                            records.append(record)
-                            if not record.get("testing_mode", False):  # Only count real costs
-                                total_cost += record.get("cost_usd", 0)
-                                call_count += 1
-                    except (json.JSONDecodeError, KeyError, ValueError):
-                        continue
+            for line in _iter_lines_reversed(self.log_file_path):
+                # Decide on the window from the timestamp alone before parsing the record
+                match = _TIMESTAMP_RE.search(line)
+                if match is None:
+                    continue
+                if match.group(1) < cutoff:
+                    break
+                
+                try:
+                    record = orjson.loads(line)
+                except ValueError:
+                    continue
+                record_count += 1
+                if len(recent_records) < 10:
+                    recent_records.append(record)
+                if not record.get("testing_mode", False):  # Only count real costs
+                    total_cost += record.get("cost_usd", 0)
+                    call_count += 1
             
-            return {
+            summary = {
                 "total_cost_usd": round(total_cost, 4),
                 "real_api_calls": call_count,
-                "total_records": len(records),
+                "total_records": record_count,
                 "days": days,
-                "records": records[-10:] if records else []  # Last 10 records
+                "records": recent_records[::-1]  # Last 10 records, oldest first
             }
+            self._summary_cache = (cache_key, now, summary)
+            return dict(summary)
             
         except Exception as e:
             logging.error(f"Failed to get cost summary: {str(e)}")
             return {"error": str(e)}
 
 
+def _iter_lines_reversed(path: str, block_size: int = 65536):
+    """Yield the lines of a file from last to first, reading fixed-size blocks from the end."""
+    with open(path, "rb") as f:
+        position = f.seek(0, os.SEEK_END)
+        remainder = b""
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            lines = (f.read(read_size) + remainder).split(b"\n")
+            # The first piece may be the tail of a line that starts in an earlier block
+            remainder = lines[0]
+            for line in reversed(lines[1:]):
+                if line:
+                    yield line
+        if remainder:
+            yield remainder
+
+
 # Global cost tracker instance
 _cost_tracker = None
 _tracker_lock = threading.Lock()
@@ -3,14 +3,101 @@ Durable Functions orchestrator for async job polling workflow.
 Contains only the methods needed for async job management with OpenAI Deep Research API.
 """
 
+import hashlib
 import logging
+import threading
 import uuid
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+
+from cachetools import TTLCache
 
 from .research_models import ResearchOutput, get_research_output_parser, get_json_list_parser, get_json_dict_parser
 from .http_utils import is_testing_mode
 from .prompt_manager import prompt_manager
-from common import get_openai_client
+from common import get_shared_async_openai_client, get_shared_openai_client
+
+# Planner results keyed by a digest of the planning prompt's inputs (model,
+# num_topics, agent personality, user input; the template is fixed per process);
+# repeat submissions of the same idea within the TTL skip the planning call.
+# Least recently used entries are evicted first once the cache is full.
+_RESEARCH_TOPICS_CACHE: "TTLCache[bytes, Tuple[str, ...]]" = TTLCache(maxsize=256, ttl=3600)
+_RESEARCH_TOPICS_CACHE_LOCK = threading.Lock()
+
+
+def _research_topics_key(
+    model: str, num_topics: int, agent_personality: str, user_input: Dict[str, Any]
+) -> bytes:
+    # repr keeps key order and value types, both of which change the rendered prompt
+    return hashlib.blake2b(
+        f"{model}\0{num_topics}\0{agent_personality}\0{tuple(user_input.items())!r}".encode("utf-8"),
+        digest_size=16,
+    ).digest()
+
+
+def _get_cached_research_topics(key: bytes) -> Optional[List[str]]:
+    with _RESEARCH_TOPICS_CACHE_LOCK:
+        topics = _RESEARCH_TOPICS_CACHE.get(key)
+    return None if topics is None else list(topics)
+
+
+def _cache_research_topics(key: bytes, topics: List[str]) -> None:
+    with _RESEARCH_TOPICS_CACHE_LOCK:
+        _RESEARCH_TOPICS_CACHE[key] = tuple(topics)
+
+
+# Background research jobs keyed by a digest of (model, research prompt); an
+# identical research prompt reuses the earlier job and its stored result.
+# Jobs that fail are dropped so the next request starts a fresh one.
+_RESEARCH_JOBS_CACHE: "TTLCache[bytes, str]" = TTLCache(maxsize=256, ttl=3600)
+_RESEARCH_JOBS_CACHE_LOCK = threading.Lock()
+_FAILED_JOB_STATUSES = frozenset({"failed", "cancelled", "incomplete"})
+
+
+def _research_job_key(model: str, research_prompt: str) -> bytes:
+    return hashlib.blake2b(
+        f"{model}\0{research_prompt}".encode("utf-8"), digest_size=16
+    ).digest()
+
+
+def _get_cached_research_job(key: bytes) -> Optional[str]:
+    with _RESEARCH_JOBS_CACHE_LOCK:
+        return _RESEARCH_JOBS_CACHE.get(key)
+
+
+def _cache_research_job(key: bytes, job_id: str) -> None:
+    with _RESEARCH_JOBS_CACHE_LOCK:
+        _RESEARCH_JOBS_CACHE[key] = job_id
+
+
+def _forget_research_job(job_id: str) -> None:
+    # A scan of at most maxsize entries, only on failure; a separate reverse
+    # index would evict independently and could leave the failed job cached
+    with _RESEARCH_JOBS_CACHE_LOCK:
+        for key in [key for key, cached_id in _RESEARCH_JOBS_CACHE.items() if cached_id == job_id]:
+            del _RESEARCH_JOBS_CACHE[key]
+
+
+# Request options shared by every responses.create call (read-only)
+_AUTO_REASONING = {"summary": "auto"}
+_WEB_SEARCH_TOOLS = ({"type": "web_search_preview"},)
+
+
+def _user_input_envelope(prompt: str) -> List[Dict[str, Any]]:
+    """Wrap a prompt as the single user message expected by responses.create."""
+    return [{"role": "user", "content": [{"type": "input_text", "text": prompt}]}]
+
+
+def _output_text(response: Any, error_message: str) -> str:
+    """Return the text of a response's final output message.
+
+    Raises:
+        ValueError: If the response has no output message with text content
+    """
+    try:
+        return response.output[-1].content[0].text
+    except (AttributeError, IndexError, TypeError):
+        logging.debug(f"Unexpected response shape: {response!r}")
+        raise ValueError(error_message) from None
 
 
 class DurableOrchestrator:
@@ -24,14 +111,22 @@ class DurableOrchestrator:
         """
         self.agent_config = agent_config
         self._openai_client = None
+        self._async_openai_client = None
 
     @property
     def openai_client(self):
-        """Lazy-initialized OpenAI client."""
+        """Lazy-initialized OpenAI client, shared process-wide."""
         if self._openai_client is None:
-            self._openai_client = get_openai_client()
+            self._openai_client = get_shared_openai_client()
         return self._openai_client
 
+    @property
+    def async_openai_client(self):
+        """Lazy-initialized AsyncOpenAI client used by the async job methods."""
+        if self._async_openai_client is None:
+            self._async_openai_client = get_shared_async_openai_client()
+        return self._async_openai_client
+
     def create_research_plan(
         self, user_input: Dict[str, Any], budget_tier: str
     ) -> Dict[str, Any]:
@@ -44,18 +139,8 @@ class DurableOrchestrator:
         Returns:
             Research plan with topics and call allocation
         """
-        # Find tier configuration
-        tier_config = None
-        for tier in self.agent_config.get_budget_tiers():
-            if tier.name == budget_tier:
-                tier_config = tier
-                break
-
-        if tier_config is None:
-            available_tiers = [t.name for t in self.agent_config.get_budget_tiers()]
-            raise ValueError(
-                f"Invalid budget tier '{budget_tier}'. Available: {available_tiers}"
-            )
+        # Find tier configuration (raises ValidationError for unknown tiers)
+        tier_config = self.agent_config.get_budget_tier(budget_tier)
 
         # Calculate research vs synthesis allocation based on dynamic pricing model
         research_calls = tier_config.num_research_calls
@@ -106,6 +191,15 @@ class DurableOrchestrator:
         # Get agent personality to understand what type of analysis this is
         agent_personality = self.agent_config.definition.starter_prompt
 
+        # The planning prompt is fully determined by these inputs, so reuse an
+        # earlier plan before rendering it
+        model = self.agent_config.get_model('planning')
+        cache_key = _research_topics_key(model, num_topics, agent_personality, user_input)
+        cached_topics = _get_cached_research_topics(cache_key)
+        if cached_topics is not None:
+            logging.info(f"Reusing {len(cached_topics)} cached research topics")
+            return cached_topics
+
         # Use centralized research planning template from platform.yaml
         planning_prompt = prompt_manager.format_research_planning_prompt(
             agent_personality=agent_personality,
@@ -116,46 +210,39 @@ class DurableOrchestrator:
         try:
             # Use OpenAI to generate research plan
             response = self.openai_client.responses.create(
-                model=self.agent_config.get_model('planning'),
-                input=[
-                    {
-                        "role": "user",
-                        "content": [{"type": "input_text", "text": planning_prompt}],
-                    }
-                ],
+                model=model,
+                input=_user_input_envelope(planning_prompt),
                 background=False,  # Synchronous for planning
-                reasoning={"summary": "auto"},
+                reasoning=_AUTO_REASONING,
             )
 
             # Parse response with automatic JSON fixing
-            if hasattr(response, 'output') and response.output:
-                response_text = response.output[-1].content[0].text.strip()
+            response_text = _output_text(response, "No output from planning agent").strip()
 
-                # Use robust JSON parser with automatic error correction
-                parser = get_json_list_parser()
-                topics = parser.parse(response_text)
-
-                if isinstance(topics, list) and len(topics) == num_topics:
-                    logging.info(
-                        f"Generated {len(topics)} research topics using planning agent"
-                    )
-                    return topics
-                else:
-                    logging.warning(
-                        f"Planning agent returned {len(topics)} topics, expected {num_topics}"
-                    )
-                    # Adjust list size if needed
-                    if len(topics) > num_topics:
-                        return topics[:num_topics]
-                    else:
-                        # Pad with generic topics if needed
-                        while len(topics) < num_topics:
-                            topics.append(
-                                f"Additional analysis aspect {len(topics) + 1}"
-                            )
-                        return topics
+            # Use robust JSON parser with automatic error correction
+            parser = get_json_list_parser()
+            topics = parser.parse(response_text)
+
+            if isinstance(topics, list) and len(topics) == num_topics:
+                logging.info(
+                    f"Generated {len(topics)} research topics using planning agent"
+                )
+                _cache_research_topics(cache_key, topics)
+                return topics
             else:
-                raise ValueError("No output from planning agent")
+                logging.warning(
+                    f"Planning agent returned {len(topics)} topics, expected {num_topics}"
+                )
+                # Adjust list size if needed
+                if len(topics) > num_topics:
+                    return topics[:num_topics]
+                else:
+                    # Pad with generic topics if needed
+                    while len(topics) < num_topics:
+                        topics.append(
+                            f"Additional analysis aspect {len(topics) + 1}"
+                        )
+                    return topics
 
         except Exception as e:
             logging.error(f"Research planning failed: {str(e)}")
@@ -187,24 +274,34 @@ class DurableOrchestrator:
             user_input=user_input,
             json_format_instructions=get_research_output_parser().get_format_instructions(),
         )
+
+        # An identical prompt was already researched: reuse that job's result
+        model = self.agent_config.get_model('research')
+        use_cache = self.agent_config.get_universal_setting('enable_caching', True)
+        job_key = _research_job_key(model, research_prompt)
+        cached_job_id = _get_cached_research_job(job_key) if use_cache else None
+        if cached_job_id is not None:
+            logging.info(f"Reusing research job {cached_job_id} for topic: {research_topic}")
+            return {
+                "job_id": cached_job_id,
+                "status": "started",
+                "research_topic": research_topic
+            }
         
         try:
             # Start async research job with OpenAI Deep Research API
-            response = self.openai_client.responses.create(
-                model=self.agent_config.get_model('research'),
-                input=[
-                    {
-                        "role": "user",
-                        "content": [{"type": "input_text", "text": research_prompt}],
-                    }
-                ],
+            response = await self.async_openai_client.responses.create(
+                model=model,
+                input=_user_input_envelope(research_prompt),
                 background=True,  # Async job - runs on OpenAI's servers
-                reasoning={"summary": "auto"},
+                reasoning=_AUTO_REASONING,
             )
             
             # Extract job ID from response
             job_id = response.id  # OpenAI returns job ID for background tasks
             logging.info(f"Started async research job {job_id} for topic: {research_topic}")
+            if use_cache:
+                _cache_research_job(job_key, job_id)
             
             return {
                 "job_id": job_id,
@@ -242,10 +339,12 @@ class DurableOrchestrator:
         
         try:
             # Check job status using OpenAI API
-            status_response = self.openai_client.responses.retrieve(job_id)
+            status_response = await self.async_openai_client.responses.retrieve(job_id)
             
             status = status_response.status  # 'running', 'succeeded', 'completed', 'failed'
             ready_for_fetch = status in ['succeeded', 'completed']
+            if status in _FAILED_JOB_STATUSES:
+                _forget_research_job(job_id)
             
             logging.info(f"Job {job_id} status: {status}")
             
@@ -257,6 +356,7 @@ class DurableOrchestrator:
             
         except Exception as e:
             logging.error(f"Failed to check status for job {job_id}: {str(e)}")
+            _forget_research_job(job_id)
             return {
                 "job_id": job_id,
                 "status": "failed",
@@ -288,12 +388,9 @@ class DurableOrchestrator:
         
         try:
             # Fetch completed job result
-            result_response = self.openai_client.responses.retrieve(job_id)
-            
-            if not hasattr(result_response, 'output') or not result_response.output:
-                raise ValueError(f"No output available for job {job_id}")
+            result_response = await self.async_openai_client.responses.retrieve(job_id)
             
-            response_text = result_response.output[-1].content[0].text
+            response_text = _output_text(result_response, f"No output available for job {job_id}")
             
             # Parse structured output with automatic JSON fixing
             parser = get_research_output_parser()
@@ -335,17 +432,12 @@ class DurableOrchestrator:
         
         try:
             # Start async synthesis job
-            response = self.openai_client.responses.create(
+            response = await self.async_openai_client.responses.create(
                 model=self.agent_config.get_model('synthesis'),
-                input=[
-                    {
-                        "role": "user",
-                        "content": [{"type": "input_text", "text": synthesis_prompt}],
-                    }
-                ],
+                input=_user_input_envelope(synthesis_prompt),
                 background=True,  # Async job - runs on OpenAI's servers
-                tools=[{"type": "web_search_preview"}],
-                reasoning={"summary": "auto"},
+                tools=list(_WEB_SEARCH_TOOLS),
+                reasoning=_AUTO_REASONING,
             )
             
             job_id = response.id
@@ -378,12 +470,11 @@ class DurableOrchestrator:
         
         try:
             # Fetch completed synthesis result
-            result_response = self.openai_client.responses.retrieve(job_id)
-            
-            if not hasattr(result_response, 'output') or not result_response.output:
-                raise ValueError(f"No synthesis output available for job {job_id}")
+            result_response = await self.async_openai_client.responses.retrieve(job_id)
             
-            response_text = result_response.output[-1].content[0].text
+            response_text = _output_text(
+                result_response, f"No synthesis output available for job {job_id}"
+            )
             
             # Use robust JSON parser with automatic error correction
             try:
@@ -1,30 +1,44 @@
 """HTTP utilities for Azure Functions with consistent response formatting."""
 import azure.functions as func
+import functools
 import json
 import logging
-import traceback
+import orjson
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 
 
-def is_testing_mode() -> bool:
-    """Check if we're in testing mode to prevent API charges."""
+@functools.lru_cache(maxsize=1)
+def _configured_testing_mode() -> bool:
+    """Read the deployment's testing-mode settings once per process.
+
+    Call _configured_testing_mode.cache_clear() after changing them.
+    """
     return (
         os.getenv("TESTING_MODE", "false").lower() == "true" or
-        os.getenv("PYTEST_CURRENT_TEST") is not None or
         "test" in os.getenv("AZURE_FUNCTIONS_ENVIRONMENT", "").lower()
     )
 
 
+def is_testing_mode() -> bool:
+    """Check if we're in testing mode to prevent API charges.
+
+    PYTEST_CURRENT_TEST is checked on every call: pytest only sets it once a
+    test starts, so caching it (e.g. from an import-time call) would switch
+    off the charge guard for the whole test run.
+    """
+    return "PYTEST_CURRENT_TEST" in os.environ or _configured_testing_mode()
+
+
 def build_json_response(
-    data: Dict[str, Any], 
+    data: Union[Dict[str, Any], bytes], 
     status_code: int = 200,
     headers: Optional[Dict[str, str]] = None
 ) -> func.HttpResponse:
     """Build standardized JSON HTTP response.
     
     Args:
-        data: Response data dictionary
+        data: Response data dictionary, or an already-serialized JSON body
         status_code: HTTP status code (default: 200)
         headers: Optional HTTP headers
         
@@ -36,13 +50,36 @@ def build_json_response(
         default_headers.update(headers)
         
     return func.HttpResponse(
-        json.dumps(data),
+        data if isinstance(data, bytes) else orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS),
         status_code=status_code,
         headers=default_headers,
         mimetype="application/json"
     )
 
 
+# Helpful context for ChatGPT bot, by status code
+_ERROR_SUGGESTIONS = {
+    400: "Please check your request format and required fields",
+    500: "This is a server error. Please try again or contact support",
+}
+
+_TESTING_MODE_NOTE = {
+    "testing_mode": True,
+    "note": "Running in testing mode - no API charges incurred",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _error_body_tail(status_code: int, testing_mode: bool) -> bytes:
+    """Serialized suggestion and testing-mode keys that close an error body."""
+    tail = {}
+    if status_code in _ERROR_SUGGESTIONS:
+        tail["suggestion"] = _ERROR_SUGGESTIONS[status_code]
+    if testing_mode:
+        tail.update(_TESTING_MODE_NOTE)
+    return b"," + orjson.dumps(tail)[1:] if tail else b"}"
+
+
 def build_error_response(
     message: str, 
     status_code: int = 400,
@@ -77,32 +114,19 @@ def build_error_response(
     log_func(log_message)
     
     if include_traceback:
-        logger.error(f"Full traceback: {traceback.format_exc()}")
-    
-    # Build user-friendly error response for ChatGPT bot
-    error_data = {
-        "error": message,
-        "status": "error",
-        "success": False
-    }
+        # exc_info defers formatting to the handlers that actually emit the record
+        logger.error("Full traceback", exc_info=True)
     
+    # Build user-friendly error response for ChatGPT bot: only the message,
+    # error type and details vary, the rest comes from a cached tail
+    body = b'{"error":' + orjson.dumps(message) + b',"status":"error","success":false'
     if error_type:
-        error_data["error_type"] = error_type
+        body += b',"error_type":' + orjson.dumps(error_type)
     if details:
-        error_data["details"] = details
+        body += b',"details":' + orjson.dumps(details, option=orjson.OPT_NON_STR_KEYS)
+    body += _error_body_tail(status_code, is_testing_mode())
         
-    # Add helpful context for ChatGPT bot
-    if status_code == 400:
-        error_data["suggestion"] = "Please check your request format and required fields"
-    elif status_code == 500:
-        error_data["suggestion"] = "This is a server error. Please try again or contact support"
-    
-    # Add testing mode warning if applicable
-    if is_testing_mode():
-        error_data["testing_mode"] = True
-        error_data["note"] = "Running in testing mode - no API charges incurred"
-        
-    return build_json_response(error_data, status_code)
+    return build_json_response(body, status_code)
 
 
 def create_error_response(message: str, status_code: int = 400, error_type: str = None, suggestion: str = None) -> func.HttpResponse:
@@ -157,24 +181,14 @@ def log_and_return_error(
     Returns:
         Standardized error response
     """
-    # Comprehensive logging for debugging
-    log_details = {
-        "error_type": error_type,
-        "status_code": status_code,
-        "message": message,
-        "testing_mode": is_testing_mode()
-    }
-    
-    if context:
-        log_details["context"] = context
-    if exception:
-        log_details["exception_type"] = type(exception).__name__
-        log_details["exception_message"] = str(exception)
-    
-    logging.error(f"Error Details: {json.dumps(log_details, indent=2)}")
+    # Comprehensive logging for debugging; formatted lazily by the logging framework
+    logging.error(
+        "Error Details: error_type=%s status_code=%s message=%s testing_mode=%s context=%r exception=%r",
+        error_type, status_code, message, is_testing_mode(), context, exception
+    )
     
     if exception:
-        logging.error(f"Exception traceback: {traceback.format_exc()}")
+        logging.error("Exception traceback", exc_info=exception)
     
     return build_error_response(
         message=message,
@@ -198,18 +212,23 @@ def validate_json_request(req: func.HttpRequest) -> Dict[str, Any]:
     Raises:
         ValueError: If JSON is invalid or missing
     """
+    body = req.get_body()
+    if not body:
+        logging.warning("Received request with empty body")
+        raise ValueError("Request body is required. Please provide a JSON object with your request data.")
+    
     try:
-        req_body = req.get_json()
-        if not req_body:
-            logging.warning("Received request with empty body")
-            raise ValueError("Request body is required. Please provide a JSON object with your request data.")
-        
-        logging.info(f"Successfully parsed request with keys: {list(req_body.keys())}")
-        return req_body
-        
-    except json.JSONDecodeError as e:
-        logging.error(f"JSON decode error: {str(e)}")
-        raise ValueError(f"Invalid JSON in request body: {str(e)}. Please check your JSON formatting.")
-    except Exception as e:
-        logging.error(f"Unexpected error parsing request: {str(e)}")
-        raise ValueError(f"Failed to parse request: {str(e)}")
+        req_body = orjson.loads(body)
+    except orjson.JSONDecodeError as e:
+        logging.error("JSON decode error: %s", e)
+        raise ValueError(f"Invalid JSON in request body: {str(e)}. Please check your JSON formatting.") from None
+    
+    if not req_body:
+        logging.warning("Received request with empty body")
+        raise ValueError("Request body is required. Please provide a JSON object with your request data.")
+    if not isinstance(req_body, dict):
+        logging.error("Request body is a JSON %s, not an object", type(req_body).__name__)
+        raise ValueError("Request body must be a JSON object.")
+    
+    logging.debug("Successfully parsed request with keys: %r", req_body.keys())
+    return req_body
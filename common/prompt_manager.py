@@ -1,12 +1,43 @@
 """Prompt and model configuration manager for Universal AI Agent Platform."""
 
+import functools
+import json
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import logging
+from jinja2 import Template
 from common.http_utils import is_testing_mode
 
 
+@functools.lru_cache(maxsize=32)
+def _output_schema_text(fields: Tuple[Tuple[str, str], ...]) -> Tuple[str, str]:
+    """Build the JSON schema and field definition text for (name, description) output fields."""
+    json_schema = "{\n" + ",\n".join([f'  "{name}": "string"' for name, _ in fields]) + "\n}"
+    field_definitions = "\n".join([f"- **{name}**: {description}" for name, description in fields])
+    return json_schema, field_definitions
+
+
+@functools.lru_cache(maxsize=32)
+def _field_names_json(field_names: Tuple[str, ...]) -> str:
+    """Build the example request body listing each input field name."""
+    return json.dumps({name: "user_provided_value" for name in field_names}, indent=2)
+
+
+@functools.lru_cache(maxsize=128)
+def _user_input_markdown_cached(items: Tuple[Tuple[str, str], ...]) -> str:
+    return "\n".join([f"**{key}**: {value}" for key, value in items])
+
+
+def _user_input_markdown(user_input: Dict[str, Any]) -> str:
+    """Format user input as "**key**: value" lines, reused across a job's research calls."""
+    items = tuple(user_input.items())
+    # Only all-string input is cached: equal non-string values (1, 1.0, True) format differently
+    if all(type(value) is str for _, value in items):
+        return _user_input_markdown_cached(items)
+    return "\n".join([f"**{key}**: {value}" for key, value in items])
+
+
 class PromptManager:
     """Manages prompts and model configurations for the platform."""
     
@@ -14,6 +45,9 @@ class PromptManager:
         """Initialize the prompt manager."""
         self._common_config = None
         self._config_path = None
+        self._models: Optional[Dict[str, str]] = None
+        self._prompts: Optional[Dict[str, str]] = None
+        self._jinja_templates: Dict[str, Template] = {}
         
     def _load_common_config(self) -> Dict[str, Any]:
         """Load common prompts configuration."""
@@ -22,17 +56,35 @@ class PromptManager:
             current_path = Path(__file__).parent
             config_path = current_path / 'platform.yaml'
             
-            if not config_path.exists():
-                raise ValueError(f"Platform configuration not found at: {config_path}")
+            try:
+                f = open(config_path, 'r', encoding='utf-8')
+            except FileNotFoundError:
+                raise ValueError(f"Platform configuration not found at: {config_path}") from None
             
-            with open(config_path, 'r', encoding='utf-8') as f:
+            with f:
                 self._common_config = yaml.safe_load(f)
                 self._config_path = config_path
             
+            # Sections read on every call, resolved once per load
+            platform_config = self._common_config.get('platform', {})
+            self._models = platform_config.get('models', {})
+            self._prompts = platform_config.get('prompts', {})
+            
             logging.info(f"Loaded common prompts config from: {config_path}")
         
         return self._common_config
     
+    def clear_cache(self) -> None:
+        """Drop the loaded platform.yaml and compiled templates so the next use reloads them.
+
+        platform.yaml is otherwise parsed once per process.
+        """
+        self._common_config = None
+        self._config_path = None
+        self._models = None
+        self._prompts = None
+        self._jinja_templates.clear()
+    
     def get_model(self, model_type: str) -> str:
         """Get model name for a specific function.
         
@@ -42,14 +94,13 @@ class PromptManager:
         Returns:
             Model name string
         """
-        config = self._load_common_config()
-        platform_config = config.get('platform', {})
-        models = platform_config.get('models', {})
-        
-        if model_type not in models:
-            raise ValueError(f"Unknown model type: {model_type}. Available: {list(models.keys())}")
+        if self._models is None:
+            self._load_common_config()
         
-        return models[model_type]
+        try:
+            return self._models[model_type]
+        except KeyError:
+            raise ValueError(f"Unknown model type: {model_type}. Available: {list(self._models.keys())}") from None
     
     def get_prompt_template(self, prompt_name: str) -> str:
         """Get a common prompt template.
@@ -60,14 +111,21 @@ class PromptManager:
         Returns:
             Prompt template string
         """
-        config = self._load_common_config()
-        platform_config = config.get('platform', {})
-        prompts = platform_config.get('prompts', {})
+        if self._prompts is None:
+            self._load_common_config()
         
-        if prompt_name not in prompts:
-            raise ValueError(f"Unknown prompt: {prompt_name}. Available: {list(prompts.keys())}")
-        
-        return prompts[prompt_name]
+        try:
+            return self._prompts[prompt_name]
+        except KeyError:
+            raise ValueError(f"Unknown prompt: {prompt_name}. Available: {list(self._prompts.keys())}") from None
+    
+    def _get_jinja_template(self, prompt_name: str) -> Template:
+        """Get a prompt template compiled with Jinja2, compiling it once."""
+        template = self._jinja_templates.get(prompt_name)
+        if template is None:
+            template = Template(self.get_prompt_template(prompt_name))
+            self._jinja_templates[prompt_name] = template
+        return template
     
     
     def format_synthesis_call_prompt(
@@ -88,23 +146,13 @@ class PromptManager:
         Returns:
             Formatted synthesis call prompt with Jinja2 template rendered
         """
-        from jinja2 import Template
-        
-        template_str = self.get_prompt_template('synthesis_call')
-        
-        # Generate JSON schema structure
-        json_fields = []
-        field_definitions = []
-        
-        for field in output_fields:
-            json_fields.append(f'  "{field.name}": "string"')
-            field_definitions.append(f"- **{field.name}**: {field.description}")
-        
-        json_schema = "{\n" + ",\n".join(json_fields) + "\n}"
-        field_definitions_str = "\n".join(field_definitions)
+        # JSON schema structure depends only on the output fields
+        json_schema, field_definitions_str = _output_schema_text(
+            tuple((field.name, field.description) for field in output_fields)
+        )
         
-        # Create Jinja2 template and render with ResearchOutput objects
-        jinja_template = Template(template_str)
+        # Render compiled Jinja2 template with ResearchOutput objects
+        jinja_template = self._get_jinja_template('synthesis_call')
         
         return jinja_template.render(
             agent_personality=agent_personality,
@@ -133,7 +181,7 @@ class PromptManager:
         template = self.get_prompt_template('research_planning')
         
         # Format user input summary
-        user_input_summary = "\n".join([f"**{key}**: {value}" for key, value in user_input.items()])
+        user_input_summary = _user_input_markdown(user_input)
         
         return template.format(
             agent_personality=agent_personality,
@@ -162,7 +210,7 @@ class PromptManager:
         template = self.get_prompt_template('research_call')
         
         # Format user input generically
-        formatted_user_input = "\n".join([f"**{key}**: {value}" for key, value in user_input.items()])
+        formatted_user_input = _user_input_markdown(user_input)
         
         return template.format(
             starter_prompt=starter_prompt,
@@ -185,17 +233,11 @@ class PromptManager:
         Returns:
             Formatted user instructions with field descriptions and better formatting
         """
-        from jinja2 import Template
-        import json
-        
-        template_str = self.get_prompt_template('user_instructions')
-        
         # Create field names JSON for API calls
-        field_names = [field.name for field in input_fields]
-        field_names_json = json.dumps({name: "user_provided_value" for name in field_names}, indent=2)
+        field_names_json = _field_names_json(tuple(field.name for field in input_fields))
         
-        # Create Jinja2 template and render
-        jinja_template = Template(template_str)
+        # Render compiled Jinja2 template
+        jinja_template = self._get_jinja_template('user_instructions')
         
         return jinja_template.render(
             agent_name=agent_name,
@@ -3,7 +3,9 @@ Research data models for LangChain structured output parsing.
 Used in the research→synthesis workflow for structured JSON handoff.
 """
 
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, List, Optional
+
+import orjson
 from pydantic import BaseModel, Field
 from langchain_core.output_parsers import PydanticOutputParser, JsonOutputParser
 from langchain.output_parsers import OutputFixingParser
@@ -76,13 +78,51 @@ def _get_fixing_llm():
     )
 
 
+def _json_span(text: str, open_char: str, close_char: str) -> str:
+    """Return the outermost open_char...close_char span of text.
+
+    Model output often wraps its JSON in a markdown fence or a short preamble;
+    slicing to the enclosing brackets lets the fast parsers skip fence handling.
+    """
+    start = text.find(open_char)
+    end = text.rfind(close_char)
+    if start == -1 or end < start:
+        raise ValueError(f"No JSON value starting with {open_char!r} found")
+    return text[start:end + 1]
+
+
+def _loads_json_list(text: str) -> Any:
+    return orjson.loads(_json_span(text, "[", "]"))
+
+
+def _loads_json_dict(text: str) -> Any:
+    return orjson.loads(_json_span(text, "{", "}"))
+
+
+def _loads_research_output(text: str) -> "ResearchOutput":
+    return ResearchOutput.model_validate_json(_json_span(text, "{", "}"))
+
+
 class LayeredParser:
-    """Parser that tries clean_json_response before falling back to base parser."""
+    """Parser that tries clean_json_response before falling back to base parser.
     
-    def __init__(self, base_parser):
+    An optional fast_parse callable is tried first on the raw text; model
+    output that is already plain JSON skips the base parser's markdown handling.
+    """
+    
+    def __init__(self, base_parser, fast_parse: Optional[Callable[[str], Any]] = None):
         self.base_parser = base_parser
+        self.fast_parse = fast_parse
+        self._format_instructions: Optional[str] = None
     
     def parse(self, text: str):
+        # Layer 0: Strict JSON straight through the fast parser
+        if self.fast_parse is not None:
+            try:
+                return self.fast_parse(text)
+            except Exception:
+                pass
+        
         # Layer 1: Try direct parsing first
         try:
             return self.base_parser.parse(text)
@@ -96,7 +136,10 @@ class LayeredParser:
                 raise
     
     def get_format_instructions(self):
-        return self.base_parser.get_format_instructions()
+        # Built from the model's JSON schema, which is fixed; every research prompt embeds it
+        if self._format_instructions is None:
+            self._format_instructions = self.base_parser.get_format_instructions()
+        return self._format_instructions
 
 
 def get_research_output_parser() -> OutputFixingParser:
@@ -112,7 +155,7 @@ def get_research_output_parser() -> OutputFixingParser:
     global _research_parser
     if _research_parser is None:
         base_parser = PydanticOutputParser(pydantic_object=ResearchOutput)
-        layered_parser = LayeredParser(base_parser)
+        layered_parser = LayeredParser(base_parser, fast_parse=_loads_research_output)
         _research_parser = OutputFixingParser.from_llm(
             parser=layered_parser,
             llm=_get_fixing_llm(),
@@ -134,7 +177,7 @@ def get_json_list_parser() -> OutputFixingParser:
     global _list_parser
     if _list_parser is None:
         base_parser = JsonOutputParser()
-        layered_parser = LayeredParser(base_parser)
+        layered_parser = LayeredParser(base_parser, fast_parse=_loads_json_list)
         _list_parser = OutputFixingParser.from_llm(
             parser=layered_parser,
             llm=_get_fixing_llm(),
@@ -156,7 +199,7 @@ def get_json_dict_parser() -> OutputFixingParser:
     global _dict_parser
     if _dict_parser is None:
         base_parser = JsonOutputParser()
-        layered_parser = LayeredParser(base_parser)
+        layered_parser = LayeredParser(base_parser, fast_parse=_loads_json_dict)
         _dict_parser = OutputFixingParser.from_llm(
             parser=layered_parser,
             llm=_get_fixing_llm(),
@@ -1,13 +1,15 @@
 import os
 import re
 import json
+import functools
 import logging
+import threading
 from typing import List, Optional, Dict
 from dataclasses import dataclass
 
 import gspread
 from google.oauth2.service_account import Credentials
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 
 @dataclass
@@ -24,7 +26,7 @@ class Information:
             self.content = {column: data[column] for column in self.columns.keys()}
 
 
-def get_openai_client(api_key: Optional[str] = None) -> OpenAI:
+def _resolve_openai_api_key(api_key: Optional[str]) -> str:
     if api_key is None:
         api_key = os.getenv("OPENAI_API_KEY")
 
@@ -32,8 +34,55 @@ def get_openai_client(api_key: Optional[str] = None) -> OpenAI:
         raise ValueError(
             "OpenAI API key is required. Set OPENAI_API_KEY environment variable or pass api_key parameter."
         )
+    return api_key
+
+
+def get_openai_client(api_key: Optional[str] = None) -> OpenAI:
+    return OpenAI(api_key=_resolve_openai_api_key(api_key))
+
+
+def get_async_openai_client(api_key: Optional[str] = None) -> AsyncOpenAI:
+    return AsyncOpenAI(api_key=_resolve_openai_api_key(api_key))
+
+
+_shared_openai_client: Optional[OpenAI] = None
+_shared_openai_client_lock = threading.Lock()
 
-    return OpenAI(api_key=api_key)
+
+def get_shared_openai_client() -> OpenAI:
+    """Get a process-wide OpenAI client so its connection pool is reused across requests."""
+    global _shared_openai_client
+
+    if _shared_openai_client is None:
+        with _shared_openai_client_lock:
+            if _shared_openai_client is None:
+                _shared_openai_client = get_openai_client()
+    return _shared_openai_client
+
+
+_shared_async_openai_client: Optional[AsyncOpenAI] = None
+
+
+def get_shared_async_openai_client() -> AsyncOpenAI:
+    """Get a process-wide AsyncOpenAI client for the Functions worker's event loop.
+
+    Async activities await API calls on this client instead of blocking the
+    event loop with the sync client, so concurrent activities overlap their I/O.
+    """
+    global _shared_async_openai_client
+
+    if _shared_async_openai_client is None:
+        with _shared_openai_client_lock:
+            if _shared_async_openai_client is None:
+                _shared_async_openai_client = get_async_openai_client()
+    return _shared_async_openai_client
+
+
+@functools.lru_cache(maxsize=4)
+def _load_service_account_info(key_path: str) -> Dict:
+    """Read and parse a service account key file once per process."""
+    with open(key_path, "rb") as f:
+        return json.load(f)
 
 
 def get_google_sheets_client(
@@ -51,7 +100,9 @@ def get_google_sheets_client(
         scopes = ["https://www.googleapis.com/auth/spreadsheets"]
 
     try:
-        creds = Credentials.from_service_account_file(key_path, scopes=scopes)
+        creds = Credentials.from_service_account_info(
+            _load_service_account_info(key_path), scopes=scopes
+        )
         return gspread.authorize(creds)
     except Exception as e:
         logging.error(f"Failed to initialize Google Sheets client: {str(e)}")
@@ -74,6 +125,10 @@ def get_spreadsheet(
         raise
 
 
+_JSON_FENCE_RE = re.compile(r'^```(?:json)?|```$')
+_INVALID_ESCAPE_RE = re.compile(r'\\([^"\\rnbftu/])')
+
+
 def clean_json_response(text: str) -> str:
     """Clean JSON response by removing markdown formatting and fixing common JSON issues.
     
@@ -86,26 +141,9 @@ def clean_json_response(text: str) -> str:
     Returns:
         Cleaned JSON string ready for parsing
     """
-    cleaned = text.strip()
-
-    # Remove ```json and ``` markers
-    if cleaned.startswith('```json'):
-        cleaned = cleaned[7:]
-    elif cleaned.startswith('```'):
-        cleaned = cleaned[3:]
-
-    if cleaned.endswith('```'):
-        cleaned = cleaned[:-3]
-
-    cleaned = cleaned.strip()
+    # Remove a leading ```json / ``` marker and a trailing ``` in one pass
+    cleaned = _JSON_FENCE_RE.sub('', text.strip()).strip()
 
     # Fix common JSON escape issues
-    # Fix invalid escape sequences like \$ -> $
-    import re
-
-    # Replace invalid escape sequences with the literal character
-    cleaned = re.sub(r'\\([^"\\rnbftu/])', r'\1', cleaned)
-
-    return cleaned
-
-
+    # Replace invalid escape sequences like \$ with the literal character
+    return _INVALID_ESCAPE_RE.sub(r'\1', cleaned)
@@ -75,17 +75,32 @@ def _execute_research_jobs(
     research_topics: List[str],
     user_input: Dict[str, Any],
     agent_config_data: Dict[str, Any],
+    max_polls: int = MAX_POLLS,
 ) -> List[Dict[str, Any]]:
-    """Execute all research jobs sequentially and collect successful results."""
-    research_results = []
+    """Execute all research jobs concurrently and collect successful results.
 
-    for i, topic in enumerate(research_topics):
-        logging.info(
-            f"[DURABLE-ORCHESTRATOR] Starting research job {i+1}/{len(research_topics)}: {topic}"
-        )
+    Jobs are started, polled and fetched as Durable fan-out/fan-in batches, so
+    the research phase lasts as long as the slowest job instead of the sum of
+    all jobs. Results keep the order of research_topics.
+
+    Every job shares the same user input, so topics that repeat (ignoring
+    surrounding whitespace) would send identical prompts; each distinct topic
+    is researched only once. Empty topics are dropped.
+    """
+    research_topics = [
+        topic for topic in dict.fromkeys(str(topic).strip() for topic in research_topics if topic is not None)
+        if topic
+    ]
+    if not research_topics:
+        return []
+
+    logging.info(
+        f"[DURABLE-ORCHESTRATOR] Starting {len(research_topics)} research jobs"
+    )
 
-        # Step 1: Start async research job
-        job_info = yield context.call_activity(
+    # Step 1: Start all async research jobs at once
+    job_infos = yield context.task_all([
+        context.call_activity(
             "start_research_job",
             {
                 "research_topic": topic,
@@ -93,45 +108,94 @@ def _execute_research_jobs(
                 "agent_config_data": agent_config_data,
             },
         )
+        for topic in research_topics
+    ])
 
+    # Running jobs by job ID, in topic order
+    pending: Dict[str, str] = {}
+    for topic, job_info in zip(research_topics, job_infos):
         research_job_id = job_info.get("job_id")
         if not research_job_id:
             logging.error(
                 f"[DURABLE-ORCHESTRATOR] Failed to start research job for: {topic}"
             )
             continue
-
         logging.info(f"[DURABLE-ORCHESTRATOR] Started research job: {research_job_id}")
+        pending[research_job_id] = topic
+    job_order = {job_id: index for index, job_id in enumerate(pending)}
 
-        # Step 2: Poll job status until completion
-        job_completed, poll_count = yield from _poll_job_until_complete(
-            context, research_job_id, "research", agent_config_data
-        )
+    # Step 2: Poll every running job each interval until all finish
+    ready: Dict[str, str] = {}
+    poll_count = 0
+    while pending and poll_count < max_polls:
+        # Wait between polls (durable timer - no billing cost)
+        if poll_count > 0:  # Skip initial wait
+            logging.info(
+                f"[DURABLE-ORCHESTRATOR] Waiting {POLL_INTERVAL_MINUTES} minutes before next research poll "
+                f"(poll {poll_count+1}/{max_polls}, {len(pending)} jobs running)"
+            )
+            yield context.create_timer(
+                context.current_utc_datetime + timedelta(minutes=POLL_INTERVAL_MINUTES)
+            )
 
-        # Step 3: Fetch completed result
-        if job_completed:
-            result_data = yield context.call_activity(
-                "fetch_job_result",
-                {
-                    "job_id": research_job_id,
-                    "job_type": "research",
-                    "research_topic": topic,
-                    "agent_config_data": agent_config_data,
-                },
+        job_ids = list(pending)
+        status_results = yield context.task_all([
+            context.call_activity(
+                "check_job_status",
+                {"job_id": job_id, "agent_config_data": agent_config_data},
             )
+            for job_id in job_ids
+        ])
 
-            if result_data.get("status") == "completed" and result_data.get("result"):
-                research_results.append(result_data["result"])
-                logging.info(
-                    f"[DURABLE-ORCHESTRATOR] Successfully completed research for: {topic}"
-                )
-            else:
+        for research_job_id, status_result in zip(job_ids, status_results):
+            status = status_result.get("status")
+            logging.info(
+                f"[DURABLE-ORCHESTRATOR] Research job {research_job_id} status: {status}"
+            )
+            if status_result.get("ready_for_fetch", False):
+                ready[research_job_id] = pending.pop(research_job_id)
+            elif status == "failed":
                 logging.error(
-                    f"[DURABLE-ORCHESTRATOR] Failed to fetch result for: {topic}"
+                    f"[DURABLE-ORCHESTRATOR] Research job failed: {research_job_id}"
                 )
+                pending.pop(research_job_id)
+
+        poll_count += 1
+
+    for topic in pending.values():
+        logging.error(
+            f"[DURABLE-ORCHESTRATOR] Research job timed out after {poll_count} polls: {topic}"
+        )
+
+    if not ready:
+        return []
+
+    # Step 3: Fetch all completed results, keeping topic order (job IDs were
+    # added to pending in topic order)
+    ready_jobs = sorted(ready.items(), key=lambda item: job_order[item[0]])
+    result_items = yield context.task_all([
+        context.call_activity(
+            "fetch_job_result",
+            {
+                "job_id": research_job_id,
+                "job_type": "research",
+                "research_topic": topic,
+                "agent_config_data": agent_config_data,
+            },
+        )
+        for research_job_id, topic in ready_jobs
+    ])
+
+    research_results = []
+    for (_, topic), result_data in zip(ready_jobs, result_items):
+        if result_data.get("status") == "completed" and result_data.get("result"):
+            research_results.append(result_data["result"])
+            logging.info(
+                f"[DURABLE-ORCHESTRATOR] Successfully completed research for: {topic}"
+            )
         else:
             logging.error(
-                f"[DURABLE-ORCHESTRATOR] Research job timed out after {poll_count} polls: {topic}"
+                f"[DURABLE-ORCHESTRATOR] Failed to fetch result for: {topic}"
             )
 
     return research_results
@@ -7,6 +7,7 @@ from common.http_utils import (
     log_and_return_error
 )
 from common.agent_service import AnalysisService, ValidationError
+from common.errors import AnalysisError
 
 
 def main(req: func.HttpRequest) -> func.HttpResponse:
@@ -73,6 +74,17 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
             },
             exception=e
         )
+    except AnalysisError as e:
+        return log_and_return_error(
+            message=f"Analysis could not be started: {str(e)}. Please try again.",
+            status_code=503,
+            error_type="analysis_start_error",
+            context={
+                "endpoint": "execute_analysis",
+                "budget_tier": req_body.get("budget_tier") if 'req_body' in locals() else None
+            },
+            exception=e
+        )
     except KeyError as e:
         return log_and_return_error(
             message=f"Invalid budget tier selected: {str(e)}. Available tiers: basic, standard, premium",
@@ -35,15 +35,16 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
         
         # Initialize analysis service with dynamic configuration and get budget options
         analysis_service = AnalysisService(spreadsheet_id)
-        response_data = analysis_service.get_budget_options()
-        
         # Add testing mode indicator to response
+        extra = {}
         if is_testing_mode():
-            response_data["testing_mode"] = True
-            response_data["note"] = "Running in testing mode - no API charges will occur"
+            extra["testing_mode"] = True
+            extra["note"] = "Running in testing mode - no API charges will occur"
+        
+        response_body = analysis_service.get_budget_options_json(**extra)
         
-        logging.info(f"Successfully returned {len(response_data.get('pricepoints', []))} pricing options")
-        return build_json_response(response_data)
+        logging.info(f"Successfully returned {len(analysis_service.agent_config.get_budget_tiers())} pricing options")
+        return build_json_response(response_body)
         
     except ValueError as e:
         return log_and_return_error(
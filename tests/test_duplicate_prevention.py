@@ -6,9 +6,11 @@ import pytest
 import hashlib
 import json
 import os
+import threading
+import time
 from unittest.mock import Mock, patch
 
-from common.agent_service import AnalysisService
+from common.agent_service import AnalysisService, _RowAppendBatcher
 
 
 @pytest.fixture
@@ -84,15 +86,16 @@ class TestDuplicatePrevention:
         
         # Mock finding existing job
         mock_worksheet.find.return_value = mock_cell
-        mock_worksheet.cell.return_value = Mock(value="existing_job_123")
         mock_spreadsheet.get_worksheet.return_value = mock_worksheet
         
         # Check for existing job
         existing_job = analysis_service._check_existing_job(fingerprint)
         
-        # Should find existing job
+        # Should find existing job by searching only the job ID column
         assert existing_job is not None
-        assert existing_job["job_id"] == "existing_job_123"
+        assert existing_job["job_id"] == f"fp_{fingerprint}"
+        mock_worksheet.find.assert_called_once_with(f"fp_{fingerprint}", in_column=1)
+        mock_worksheet.cell.assert_not_called()
         assert existing_job["is_duplicate"] is True
         assert "already being processed" in existing_job["message"]
 
@@ -144,6 +147,19 @@ class TestDuplicatePrevention:
         # Check existing job should have been called
         mock_check_existing.assert_called_once()
 
+    def test_fingerprint_input_ignores_case_and_spacing(self, sample_user_input):
+        """Test resubmissions differing only in case or whitespace normalize to the same input."""
+        from common.agent_service import _normalize_fingerprint_input
+
+        resubmitted = {
+            key: f"  {value.upper()}\n".replace(" ", "   ") for key, value in sample_user_input.items()
+        }
+        assert _normalize_fingerprint_input(resubmitted) == _normalize_fingerprint_input(sample_user_input)
+
+        reworded = {**sample_user_input, "Idea_Overview": "AI-powered nutrition app"}
+        assert _normalize_fingerprint_input(reworded) != _normalize_fingerprint_input(sample_user_input)
+        assert _normalize_fingerprint_input({"Budget": 5}) == {"Budget": 5}
+
     def test_fingerprint_includes_all_relevant_data(self, analysis_service, sample_user_input):
         """Test that fingerprint includes all data needed for proper deduplication."""
         budget_tier = "standard"
@@ -154,7 +170,7 @@ class TestDuplicatePrevention:
         
         # Manually create expected fingerprint data
         expected_data = {
-            "user_input": sample_user_input,
+            "user_input": {key: value.casefold() for key, value in sample_user_input.items()},
             "budget_tier": budget_tier,
             "agent_id": agent_id,
             "spreadsheet_id": spreadsheet_id
@@ -208,4 +224,162 @@ class TestDuplicatePrevention:
                     
                     assert "instance_id" in orchestration_input
                     assert orchestration_input["instance_id"] == expected_job_id
-                    assert orchestration_input["job_id"] == expected_job_id
\ No newline at end of file
+                    assert orchestration_input["job_id"] == expected_job_id
+
+    @patch.dict('common.agent_service._FP_BLOOMS', clear=True)
+    @patch('common.agent_service.AnalysisService.spreadsheet')
+    def test_fingerprint_filter_skips_sheet_search(self, mock_spreadsheet, analysis_service):
+        """Test that unseen fingerprints skip the worksheet search entirely."""
+        mock_worksheet = Mock()
+        mock_worksheet.col_values.return_value = ["ID", "fp_aaaaaaaaaaaaaaaa"]
+        mock_spreadsheet.get_worksheet.return_value = mock_worksheet
+
+        assert analysis_service._check_existing_job("bbbbbbbbbbbbbbbb") is None
+        mock_worksheet.find.assert_not_called()
+
+        # Known fingerprints still go through the sheet lookup
+        mock_worksheet.find.return_value = Mock(row=2, value="fp_aaaaaaaaaaaaaaaa")
+        existing_job = analysis_service._check_existing_job("aaaaaaaaaaaaaaaa")
+        assert existing_job["job_id"] == "fp_aaaaaaaaaaaaaaaa"
+        mock_worksheet.col_values.assert_called_once_with(1)
+
+    @patch.dict('common.agent_service._FP_BLOOMS', clear=True)
+    @patch('common.agent_service.AnalysisService.spreadsheet')
+    def test_fingerprint_filter_falls_back_on_sync_error(self, mock_spreadsheet, analysis_service):
+        """Test that a failed filter sync falls back to the worksheet search."""
+        mock_worksheet = Mock()
+        mock_worksheet.col_values.side_effect = Exception("quota exceeded")
+        mock_worksheet.find.return_value = None
+        mock_spreadsheet.get_worksheet.return_value = mock_worksheet
+
+        assert analysis_service._check_existing_job("cccccccccccccccc") is None
+        mock_worksheet.find.assert_called_once()
+
+    @patch.dict('common.agent_service._FP_BLOOMS', clear=True)
+    @patch.dict('common.agent_service._FP_BLOOM_REFRESHING', clear=True)
+    def test_fingerprint_filter_sync_does_not_block_other_callers(self):
+        """Test the column read happens outside the lock and concurrent callers fall back to the sheet."""
+        from common.agent_service import _get_fingerprint_filter, _remember_job_id
+
+        read_started = threading.Event()
+        release_read = threading.Event()
+        worksheet = Mock()
+
+        def slow_col_values(column):
+            read_started.set()
+            release_read.wait(timeout=5)
+            return ["ID", "fp_aaaaaaaaaaaaaaaa"]
+
+        worksheet.col_values.side_effect = slow_col_values
+        synced = []
+        syncer = threading.Thread(target=lambda: synced.append(_get_fingerprint_filter("sheet", worksheet)))
+        syncer.start()
+        read_started.wait(timeout=5)
+
+        # Another request during the sync neither waits nor trusts a stale filter
+        assert _get_fingerprint_filter("sheet", worksheet) is None
+        _remember_job_id("sheet", "fp_bbbbbbbbbbbbbbbb")
+
+        release_read.set()
+        syncer.join(timeout=5)
+        bloom = synced[0]
+        assert "fp_aaaaaaaaaaaaaaaa" in bloom
+        assert "fp_bbbbbbbbbbbbbbbb" in bloom
+        assert _get_fingerprint_filter("sheet", worksheet) is bloom
+        worksheet.col_values.assert_called_once_with(1)
+
+
+class TestSpreadsheetRowBatching:
+    """Test group-committed spreadsheet row appends."""
+
+    def test_concurrent_rows_share_append_call(self):
+        """Rows queued during an in-flight append are written in one batch."""
+        first_write_started = threading.Event()
+        release_first_write = threading.Event()
+        worksheet = Mock()
+
+        def slow_append(rows):
+            if not first_write_started.is_set():
+                first_write_started.set()
+                release_first_write.wait(timeout=5)
+
+        worksheet.append_rows.side_effect = slow_append
+        batcher = _RowAppendBatcher()
+
+        leader = threading.Thread(target=batcher.append, args=(worksheet, ["row_0"]))
+        leader.start()
+        first_write_started.wait(timeout=5)
+
+        followers = [
+            threading.Thread(target=batcher.append, args=(worksheet, [f"row_{i}"]))
+            for i in range(1, 4)
+        ]
+        for follower in followers:
+            follower.start()
+        time.sleep(0.05)
+        release_first_write.set()
+        for thread in [leader, *followers]:
+            thread.join(timeout=5)
+
+        assert worksheet.append_rows.call_count == 2
+        assert sorted(worksheet.append_rows.call_args_list[1][0][0]) == [["row_1"], ["row_2"], ["row_3"]]
+
+    def test_append_error_reaches_caller(self):
+        """A failed batch write raises in the request that queued the row."""
+        worksheet = Mock()
+        worksheet.append_rows.side_effect = Exception("quota exceeded")
+
+        with pytest.raises(Exception, match="quota exceeded"):
+            _RowAppendBatcher().append(worksheet, ["row_0"])
+
+    @patch('common.agent_service.AnalysisService.spreadsheet')
+    def test_result_update_uses_single_range_write(self, mock_spreadsheet, analysis_service):
+        """Final results are written to all output columns in one request."""
+        mock_worksheet = Mock()
+        mock_worksheet.find.return_value = Mock(row=7)
+        mock_spreadsheet.get_worksheet.return_value = mock_worksheet
+        analysis_service._agent_config = Mock(
+            input_field_names=("Idea_Overview", "Deliverable"),
+            output_field_names=("Overall_Rating", "Analysis_Result"),
+        )
+
+        analysis_service._update_spreadsheet_record_with_results(
+            "fp_abc", {"Overall_Rating": 8, "Analysis_Result": "Strong idea"}
+        )
+
+        mock_worksheet.update_cell.assert_not_called()
+        mock_worksheet.update.assert_called_once()
+        kwargs = mock_worksheet.update.call_args.kwargs
+        assert kwargs["range_name"] == "F7:G7"
+        assert kwargs["values"] == [["8", "Strong idea"]]
+
+    @patch.dict(os.environ, {"SHEETS_SYNC_APPEND": "true"})
+    @patch('common.agent_service.AnalysisService.spreadsheet')
+    def test_new_record_row_layout(self, mock_spreadsheet, analysis_service):
+        """New rows hold ID, time, plan, inputs in schema order, then blank outputs."""
+        mock_worksheet = Mock()
+        mock_spreadsheet.get_worksheet.return_value = mock_worksheet
+        analysis_service._agent_config = Mock(
+            input_field_names=("Idea_Overview", "Deliverable"),
+            output_field_names=("Overall_Rating", "Analysis_Result"),
+            empty_output_values=("", ""),
+        )
+
+        analysis_service._create_spreadsheet_record(
+            "fp_abc", "2025-01-28 12:00:00", {"Deliverable": "App", "Idea_Overview": "Idea"}
+        )
+
+        mock_worksheet.append_row.assert_called_once_with(
+            ["fp_abc", "2025-01-28 12:00:00", "", "Idea", "App", "", ""]
+        )
+
+    @patch.dict('common.agent_service._SPREADSHEETS', clear=True)
+    @patch('common.agent_service.get_spreadsheet')
+    def test_spreadsheet_opened_once_across_services(self, mock_get_spreadsheet):
+        """Services for the same spreadsheet share one opened Spreadsheet."""
+        first = AnalysisService("test_spreadsheet_id")
+        second = AnalysisService("test_spreadsheet_id")
+        first._sheets_client = second._sheets_client = Mock()
+
+        assert first.spreadsheet is second.spreadsheet
+        mock_get_spreadsheet.assert_called_once_with("test_spreadsheet_id", first._sheets_client)
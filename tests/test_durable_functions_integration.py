@@ -249,6 +249,7 @@ class TestDurableFunctionsIntegration:
         mock_post.return_value = mock_response
         
         from common.agent_service import AnalysisService
+        from common.errors import AnalysisError
         
         with patch('common.agent_service.AnalysisService.validate_user_input'), \
              patch('common.agent_service.AnalysisService.agent_config') as mock_config, \
@@ -271,16 +272,15 @@ class TestDurableFunctionsIntegration:
             }
             mock_orchestrator.return_value = orchestrator_instance
             
-            # Create service and test - should not raise exception
+            # Start failure is reported to the caller and the job row is retired
             service = AnalysisService("test_sheet_id")
-            result = service.create_analysis_job(
-                {"Idea_Overview": "Test failure handling"}, 
-                "basic"
-            )
-            
-            # Verify result is still returned despite orchestration failure
-            assert result["job_id"] == "test_job_fail"
-            assert result["status"] == "processing"
+            with patch.object(service, '_mark_start_failed') as mock_mark_failed, \
+                 pytest.raises(AnalysisError, match="HTTP 500"):
+                service.create_analysis_job(
+                    {"Idea_Overview": "Test failure handling"}, 
+                    "basic"
+                )
+            mock_mark_failed.assert_called_once()
     
     def test_summarize_idea_durable_functions_awareness(self):
         """Test that summarize_idea endpoint provides Durable Functions context."""
@@ -296,6 +296,97 @@ class TestDurableFunctionsIntegration:
         assert "Azure Durable Functions" in content, "Status should mention Azure Durable Functions"
 
 
+def _drive_orchestration(generator, respond):
+    """Run an orchestrator generator, answering each yielded task with respond(task)."""
+    result = None
+    try:
+        task = next(generator)
+        while True:
+            if task[0] == "all":
+                result = [respond(subtask) for subtask in task[1]]
+            else:
+                result = respond(task)
+            task = generator.send(result)
+    except StopIteration as stop:
+        return stop.value
+
+
+class TestResearchFanOut:
+    """Test the research phase runs all jobs as one fan-out/fan-in batch."""
+
+    def test_research_jobs_started_polled_and_fetched_together(self):
+        """Test jobs start in one batch, running jobs are polled together, and results keep topic order."""
+        import os
+        import sys
+        from datetime import datetime
+        sys.path.append(os.path.join(os.path.dirname(__file__), '../idea-guy'))
+        from analysis_orchestrator import _execute_research_jobs
+
+        context = Mock()
+        context.current_utc_datetime = datetime(2025, 1, 1)
+        context.call_activity.side_effect = lambda name, payload: ("call", name, payload)
+        context.create_timer.side_effect = lambda fire_at: ("timer",)
+        batches = []
+        context.task_all.side_effect = lambda tasks: batches.append([t[1] for t in tasks]) or ("all", tasks)
+
+        polls = {"job-a": 0, "job-b": 0}
+
+        def respond(task):
+            if task[0] == "timer":
+                return None
+            _, name, payload = task
+            if name == "start_research_job":
+                job_ids = {"Market": "job-a", "Competition": "job-b", "Pricing": None}
+                return {"job_id": job_ids[payload["research_topic"]]}
+            if name == "check_job_status":
+                polls[payload["job_id"]] += 1
+                ready = payload["job_id"] == "job-a" or polls["job-b"] >= 2
+                return {"status": "completed" if ready else "in_progress", "ready_for_fetch": ready}
+            return {"status": "completed", "result": {"research_topic": payload["research_topic"]}}
+
+        results = _drive_orchestration(
+            _execute_research_jobs(context, ["Market", "Competition", "Pricing"], {"Idea_Overview": "Idea"}, {}),
+            respond,
+        )
+
+        assert [r["research_topic"] for r in results] == ["Market", "Competition"]
+        assert batches == [
+            ["start_research_job"] * 3,
+            ["check_job_status"] * 2,
+            ["check_job_status"],
+            ["fetch_job_result"] * 2,
+        ]
+        assert context.create_timer.call_count == 1
+
+    def test_repeated_research_topics_started_once(self):
+        """Test repeated topics are researched once and non-string or empty topics don't break the fan-out."""
+        import os
+        import sys
+        sys.path.append(os.path.join(os.path.dirname(__file__), '../idea-guy'))
+        from analysis_orchestrator import _execute_research_jobs
+
+        context = Mock()
+        context.call_activity.side_effect = lambda name, payload: ("call", name, payload)
+        started = []
+        context.task_all.side_effect = lambda tasks: ("all", tasks)
+
+        def respond(task):
+            _, name, payload = task
+            if name == "start_research_job":
+                started.append(payload["research_topic"])
+                return {"job_id": f"job-{payload['research_topic']}"}
+            if name == "check_job_status":
+                return {"status": "completed", "ready_for_fetch": True}
+            return {"status": "completed", "result": {"research_topic": payload["research_topic"]}}
+
+        results = _drive_orchestration(
+            _execute_research_jobs(context, ["Market", "Pricing", " Market ", None, "  ", 2025], {"Idea_Overview": "Idea"}, {}),
+            respond,
+        )
+
+        assert started == ["Market", "Pricing", "2025"]
+        assert [r["research_topic"] for r in results] == ["Market", "Pricing", "2025"]
+
 class TestDurableFunctionsArchitecture:
     """Test the overall Durable Functions architecture."""
     
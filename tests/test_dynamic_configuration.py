@@ -7,6 +7,7 @@ Tests the complete configuration pipeline from YAML → Google Sheets → Runtim
 
 import pytest
 import os
+import time
 import yaml
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -32,6 +33,9 @@ class TestConfigurationModels:
         assert field.type == "user input"
         assert field.description == "Test description"
         assert field.column_index == 2
+        assert field == FieldConfig(name="Test_Field", type="user input", description="Test description", column_index=2)
+        with pytest.raises(AttributeError):
+            field.name = "Renamed"
         
         # Test all valid field types
         valid_types = ["user input", "bot output", "ID", "Time"]
@@ -87,6 +91,7 @@ class TestConfigurationModels:
         headers = schema.generate_output_headers()
         expected_headers = ["Novelty_Rating", "Market_Rating", "Feasibility_Rating", "Overall_Rating", "Analysis_Summary"]
         assert headers == expected_headers
+        assert schema.get_header_row() == ["ID", "Time", *(f.name for f in input_fields), *expected_headers]
         
         # Test input field extraction
         input_names = [field.name for field in schema.input_fields]
@@ -142,12 +147,7 @@ class TestSheetSchemaReader:
     def mock_sheets_client(self, comprehensive_mock_sheet_data):
         """Mock Google Sheets client with comprehensive data."""
         client = Mock()
-        spreadsheet = Mock()
-        worksheet = Mock()
-        
-        client.open_by_key.return_value = spreadsheet
-        spreadsheet.get_worksheet.return_value = worksheet
-        worksheet.get_values.return_value = comprehensive_mock_sheet_data
+        client.http_client.values_get.return_value = {"values": comprehensive_mock_sheet_data}
         
         return client
     
@@ -156,6 +156,12 @@ class TestSheetSchemaReader:
         reader = SheetSchemaReader(mock_sheets_client)
         schema = reader.parse_sheet_schema("https://docs.google.com/spreadsheets/d/test123/")
         
+        # Schema rows come from a single values request
+        mock_sheets_client.http_client.values_get.assert_called_once_with(
+            "test123", "A1:Z3", params={"majorDimension": "ROWS"}
+        )
+        mock_sheets_client.open_by_key.assert_not_called()
+        
         # Verify structure
         assert len(schema.input_fields) == 4  # User input fields
         assert len(schema.output_fields) == 5  # Bot output fields
@@ -185,52 +191,74 @@ class TestSheetSchemaReader:
         """Test all error scenarios for sheet parsing."""
         # Test missing rows
         mock_client = Mock()
-        mock_spreadsheet = Mock()
-        mock_worksheet = Mock()
-        mock_client.open_by_key.return_value = mock_spreadsheet
-        mock_spreadsheet.get_worksheet.return_value = mock_worksheet
+        mock_values_get = mock_client.http_client.values_get
         
         # Missing rows
-        mock_worksheet.get_values.return_value = [
+        mock_values_get.return_value = {"values": [
             ["ID", "Time", "User"],
             ["ID", "Time", "Description"]
             # Missing row 3
-        ]
+        ]}
         
         reader = SheetSchemaReader(mock_client)
         with pytest.raises(SchemaValidationError, match="Sheet must have at least 3 rows"):
             reader.parse_sheet_schema("https://docs.google.com/spreadsheets/d/test_sheet_id/")
         
         # Invalid field types
-        mock_worksheet.get_values.return_value = [
+        mock_values_get.return_value = {"values": [
             ["ID", "Time", "InvalidType"],
             ["ID", "Time", "Description"], 
             ["ID", "Time", "FieldName"]
-        ]
+        ]}
         
         with pytest.raises(SchemaValidationError, match="Invalid field type 'InvalidType'"):
             reader.parse_sheet_schema("https://docs.google.com/spreadsheets/d/test_sheet_id/")
         
         # Duplicate column names
-        mock_worksheet.get_values.return_value = [
+        mock_values_get.return_value = {"values": [
             ["ID", "Time", "User", "User"],
             ["ID", "Time", "Desc1", "Desc2"],
             ["ID", "Time", "SameName", "SameName"]
-        ]
+        ]}
         
         with pytest.raises(SchemaValidationError, match="Duplicate column name 'SameName'"):
             reader.parse_sheet_schema("https://docs.google.com/spreadsheets/d/test_sheet_id/")
         
         # Empty descriptions should cause validation error
-        mock_worksheet.get_values.return_value = [
+        mock_values_get.return_value = {"values": [
             ["ID", "Time", "user input"],
             ["ID", "Time", ""],  # Empty description
             ["ID", "Time", "FieldName"]
-        ]
+        ]}
         
         with pytest.raises(SchemaValidationError, match="Empty description for field 'FieldName'"):
             reader.parse_sheet_schema("https://docs.google.com/spreadsheets/d/test_sheet_id/")
     
+    def test_ragged_rows_treated_as_padded(self):
+        """Test rows of different lengths parse as if padded with empty cells."""
+        mock_client = Mock()
+        mock_client.http_client.values_get.return_value = {"values": [
+            ["ID", "Time", "User", "Bot", "User"],
+            ["ID", "Time", "Brief idea", "Overall rating"],
+            ["ID", "Time", "Idea_Overview", "Overall_Rating"],
+        ]}
+
+        schema = SheetSchemaReader(mock_client).parse_sheet_schema(
+            "https://docs.google.com/spreadsheets/d/test123/"
+        )
+
+        assert [f.name for f in schema.input_fields] == ["Idea_Overview"]
+        assert [(f.name, f.column_index) for f in schema.output_fields] == [("Overall_Rating", 3)]
+
+        # A named column past the end of the type row has no type
+        rows = mock_client.http_client.values_get.return_value["values"]
+        rows[1].extend(["Unused", "Extra description"])
+        rows[2].extend(["", "Extra_Field"])
+        with pytest.raises(SchemaValidationError, match="Invalid field type '' in column 6"):
+            SheetSchemaReader(mock_client).parse_sheet_schema(
+                "https://docs.google.com/spreadsheets/d/test123/"
+            )
+
     def test_sheet_access_errors(self):
         """Test sheet access error handling."""
         # Test invalid URL
@@ -241,11 +269,19 @@ class TestSheetSchemaReader:
             reader.parse_sheet_schema("https://docs.google.com/test/")
         
         # Test sheets API error
-        mock_client.open_by_key.side_effect = Exception("API Error")
+        mock_client.http_client.values_get.side_effect = Exception("API Error")
         
         with pytest.raises(SheetAccessError, match="Cannot access sheet"):
             reader.parse_sheet_schema("https://docs.google.com/spreadsheets/d/test123/")
 
+    def test_extract_sheet_id_accepts_url_or_bare_id(self):
+        """Test sheet IDs come from full URLs and bare IDs pass straight through."""
+        reader = SheetSchemaReader(Mock())
+        sheet_id = "1bGxOTEPxx3vF3UwPAK7SBUAt1dNqVWAvl3W07Zdj4rs"
+
+        assert reader._extract_sheet_id(f"https://docs.google.com/spreadsheets/d/{sheet_id}/edit#gid=0") == sheet_id
+        assert reader._extract_sheet_id(sheet_id) == sheet_id
+
 
 class TestAgentDefinition:
     """Test YAML agent definition loading with comprehensive validation."""
@@ -339,6 +375,45 @@ class TestAgentDefinition:
         with pytest.raises(ValidationError, match="agent_id must be URL-safe"):
             AgentDefinition.from_yaml(yaml_file)
     
+    def test_load_many_preserves_order_and_fills_cache(self, sample_agent_yaml, tmp_path):
+        """Test loading several definitions at once."""
+        other_yaml = tmp_path / "other_agent.yaml"
+        other_yaml.write_text(sample_agent_yaml.read_text().replace("test_agent_comprehensive", "other_agent"))
+
+        definitions = AgentDefinition.load_many([str(other_yaml), sample_agent_yaml])
+
+        assert [d.agent_id for d in definitions] == ["other_agent", "test_agent_comprehensive"]
+        assert AgentDefinition.from_yaml(sample_agent_yaml) is definitions[1]
+
+        with pytest.raises(ValidationError, match="Agent definition file not found"):
+            AgentDefinition.load_many([sample_agent_yaml, tmp_path / "missing.yaml"])
+
+    def test_agent_id_character_check(self):
+        """Test agent_id accepts only ASCII letters, digits, underscores and hyphens."""
+        from common.config.agent_definition import _validate_agent_id
+
+        _validate_agent_id("business_evaluation-v2")
+        for bad_id in ["", "trailing_newline\n", "café", "a/b", 42]:
+            with pytest.raises(ValidationError, match="agent_id must be URL-safe"):
+                _validate_agent_id(bad_id)
+
+    def test_agent_definition_cached_until_file_changes(self, sample_agent_yaml):
+        """Test that unchanged YAML is parsed once and edits are picked up."""
+        with patch('common.config.agent_definition.yaml.load', wraps=yaml.load) as mock_load:
+            first = AgentDefinition.from_yaml(sample_agent_yaml)
+            second = AgentDefinition.from_yaml(sample_agent_yaml)
+            assert second is first
+            assert mock_load.call_count == 1
+
+            sample_agent_yaml.write_text(
+                sample_agent_yaml.read_text().replace("Comprehensive Test Agent", "Renamed Test Agent")
+            )
+            stat = sample_agent_yaml.stat()
+            os.utime(sample_agent_yaml, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+            assert AgentDefinition.from_yaml(sample_agent_yaml).name == "Renamed Test Agent"
+            assert mock_load.call_count == 2
+
     def test_yaml_syntax_errors(self, tmp_path):
         """Test YAML syntax error handling."""
         invalid_yaml = "invalid: yaml: content: [unclosed"
@@ -403,6 +478,11 @@ class TestFullAgentConfiguration:
         for field in comprehensive_sheet_schema.input_fields:
             assert field.name in instructions
             assert field.description in instructions
+
+        # Instructions are rendered once per config
+        with patch('common.prompt_manager.prompt_manager.format_user_instructions_prompt') as mock_format:
+            assert config.generate_instructions() == instructions
+            mock_format.assert_not_called()
     
     def test_comprehensive_analysis_prompt_generation(self, mock_agent_definition, comprehensive_sheet_schema):
         """Test analysis prompt generation with comprehensive input."""
@@ -451,7 +531,138 @@ class TestFullAgentConfiguration:
         assert "Target_Market" in instructions
         assert "Competition" in instructions
     
-    @patch('common.config.sheet_schema_reader.SheetSchemaReader')
+    def test_budget_tiers_parsed_once_and_looked_up_by_name(self, mock_agent_definition, comprehensive_sheet_schema):
+        """Test budget tier parsing is cached and tier lookup validates names."""
+        universal_config = {"platform": {"budget_tiers": [
+            {"name": "basic", "num_research_calls": 0, "description": "Planning and synthesis only"},
+            {"name": "premium", "num_research_calls": 4, "description": "Four research calls plus synthesis"},
+        ]}}
+        config = FullAgentConfig(mock_agent_definition, comprehensive_sheet_schema, universal_config)
+
+        with patch.object(BudgetTierConfig, 'from_dict', wraps=BudgetTierConfig.from_dict) as mock_from_dict:
+            assert [t.name for t in config.get_budget_tiers()] == ["basic", "premium"]
+            assert config.get_budget_tier("premium").num_research_calls == 4
+            assert config.budget_tier_names == ("basic", "premium")
+            assert mock_from_dict.call_count == 2
+
+            # Configs built from the same platform config share the parsed tiers
+            other = FullAgentConfig(mock_agent_definition, comprehensive_sheet_schema, universal_config)
+            assert other.get_budget_tier("basic") is config.get_budget_tier("basic")
+            assert mock_from_dict.call_count == 2
+
+        with pytest.raises(ValidationError, match="Invalid budget tier 'ultra'"):
+            config.get_budget_tier("ultra")
+
+    def test_model_resolution_with_agent_overrides(self, comprehensive_sheet_schema):
+        """Test agent model overrides win over platform models and misses still explain themselves."""
+        definition = AgentDefinition(
+            "test_agent", "Test Agent", "https://docs.google.com/test", "Test prompt",
+            models={"research": "o4-mini-deep-research"},
+        )
+        universal_config = {"platform": {"models": {"planning": "o4-mini", "research": "o4-mini"}}}
+        config = FullAgentConfig(definition, comprehensive_sheet_schema, universal_config)
+
+        assert config.get_model("planning") == "o4-mini"
+        assert config.get_model("research") == "o4-mini-deep-research"
+        with pytest.raises(ValidationError, match="Unknown model type 'synthesis'"):
+            config.get_model("synthesis")
+
+        no_platform = FullAgentConfig(definition, comprehensive_sheet_schema, None)
+        assert no_platform.get_model("research") == "o4-mini-deep-research"
+        with pytest.raises(ValidationError, match="No platform configuration found"):
+            no_platform.get_model("planning")
+
+    def test_identical_tier_deliverables_are_shared(self):
+        """Test equal deliverables lists across tiers collapse to one tuple."""
+        deliverables = ["Market analysis with sources", "Risk assessment"]
+        basic = BudgetTierConfig.from_dict({
+            "name": "basic", "num_research_calls": 0,
+            "description": "Planning and synthesis only", "deliverables": list(deliverables),
+        })
+        premium = BudgetTierConfig.from_dict({
+            "name": "premium", "num_research_calls": 4,
+            "description": "Four research calls plus synthesis", "deliverables": list(deliverables),
+        })
+
+        assert basic.deliverables == tuple(deliverables)
+        assert basic.deliverables is premium.deliverables
+
+    def test_config_models_are_slotted(self):
+        """Test per-field config models carry no per-instance __dict__."""
+        field = FieldConfig("Test_Field", "user input", "Test description", 2)
+        schema = SheetSchema(input_fields=[field], output_fields=[])
+        definition = AgentDefinition("test_agent", "Test Agent", "https://docs.google.com/test", "Test prompt")
+
+        for instance in (field, schema, definition):
+            assert not hasattr(instance, "__dict__")
+        assert definition.models == {}
+
+    def test_budget_tier_is_immutable(self):
+        """Test shared tier objects cannot be mutated by callers."""
+        import dataclasses
+
+        tier = BudgetTierConfig("basic", 0, "Planning and synthesis only")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            tier.num_research_calls = 3
+        assert not hasattr(tier, "__dict__")
+        assert dataclasses.replace(tier, num_research_calls=2).num_research_calls == 2
+
+    def test_agent_config_prewarm_is_offline_and_never_raises(self):
+        """Test the import-time prewarm only reads local config and swallows failures."""
+        from common import agent_service
+
+        with patch('common.agent_service.AnalysisService') as mock_service, \
+             patch('common.agent_service.is_testing_mode') as mock_testing_mode:
+            agent_service._prewarm_agent_config()
+            mock_service.assert_not_called()
+            mock_testing_mode.assert_not_called()
+
+        with patch('common.agent_service._find_yaml_path', side_effect=FileNotFoundError("no agents")):
+            agent_service._prewarm_agent_config()
+
+    def test_budget_options_json_matches_dict(self, mock_agent_definition, comprehensive_sheet_schema):
+        """Test the pre-serialized budget options body matches get_budget_options()."""
+        import json
+        from common.agent_service import AnalysisService
+
+        universal_config = {"platform": {"models": {"planning": "gpt-4o", "research": "gpt-4o", "synthesis": "gpt-4o"}, "budget_tiers": [
+            {"name": "basic", "num_research_calls": 0, "description": "Planning and synthesis only"},
+        ]}}
+        service = AnalysisService.__new__(AnalysisService)
+        service._agent_config = FullAgentConfig(mock_agent_definition, comprehensive_sheet_schema, universal_config)
+
+        expected = service.get_budget_options()
+        body = json.loads(service.get_budget_options_json())
+        assert body.pop("timestamp").endswith("Z")
+        expected.pop("timestamp")
+        assert body == expected
+
+        body = json.loads(service.get_budget_options_json(testing_mode=True))
+        assert body["testing_mode"] is True
+        assert body["pricepoints"] == expected["pricepoints"]
+
+    def test_budget_options_changes_do_not_leak_into_cache(self, mock_agent_definition, comprehensive_sheet_schema):
+        """Test callers modifying returned pricepoints do not change later responses."""
+        from common.agent_service import AnalysisService
+
+        universal_config = {"platform": {"models": {"planning": "gpt-4o", "research": "gpt-4o", "synthesis": "gpt-4o"}, "budget_tiers": [
+            {"name": "basic", "num_research_calls": 0, "description": "Planning and synthesis only",
+             "deliverables": ["Summary"]},
+        ]}}
+        service = AnalysisService.__new__(AnalysisService)
+        service._agent_config = FullAgentConfig(mock_agent_definition, comprehensive_sheet_schema, universal_config)
+
+        options = service.get_budget_options()
+        options["pricepoints"][0]["max_cost"] = 0
+        options["pricepoints"][0]["deliverables"].append("Injected")
+
+        pricepoint = service.get_budget_options()["pricepoints"][0]
+        assert pricepoint["max_cost"] != 0
+        assert pricepoint["deliverables"] == ["Summary"]
+
+    @patch.dict('common.config.models._SCHEMA_CACHE', clear=True)
+    @patch('common.config.models.SheetSchemaReader')
     def test_full_config_from_definition(self, mock_reader_class, mock_agent_definition, comprehensive_sheet_schema):
         """Test creating FullAgentConfig from definition with sheet loading."""
         # Mock the sheet schema reader
@@ -460,7 +671,7 @@ class TestFullAgentConfiguration:
         mock_reader_class.return_value = mock_reader
         
         # Mock sheets client
-        with patch('common.utils.get_google_sheets_client') as mock_get_client:
+        with patch('common.config.models.get_google_sheets_client') as mock_get_client:
             mock_get_client.return_value = Mock()
             
             # Test config creation
@@ -471,6 +682,65 @@ class TestFullAgentConfiguration:
             assert config.definition == mock_agent_definition
 
 
+    @patch.dict('common.config.models._SCHEMA_CACHE', clear=True)
+    @patch('common.config.models.SheetSchemaReader')
+    def test_sheet_schema_reused_within_ttl(self, mock_reader_class, mock_agent_definition, comprehensive_sheet_schema):
+        """Test rebuilding a config within the TTL skips the sheet read."""
+        mock_reader_class.return_value.parse_sheet_schema.return_value = comprehensive_sheet_schema
+
+        first = FullAgentConfig.from_definition(mock_agent_definition, Mock())
+        second = FullAgentConfig.from_definition(mock_agent_definition, Mock())
+
+        assert second.schema is first.schema
+        mock_reader_class.return_value.parse_sheet_schema.assert_called_once_with(mock_agent_definition.sheet_url)
+
+        with patch('common.config.models.time.monotonic', return_value=time.monotonic() + 301):
+            FullAgentConfig.from_definition(mock_agent_definition, Mock())
+        assert mock_reader_class.return_value.parse_sheet_schema.call_count == 2
+
+    @patch.dict('common.config.models._SCHEMA_CACHE', clear=True)
+    @patch('common.config.models.SheetSchemaReader')
+    def test_configs_from_definitions_read_each_sheet_once(self, mock_reader_class, comprehensive_sheet_schema):
+        """Test building several configs reads each distinct sheet once and keeps input order."""
+        mock_reader_class.return_value.parse_sheet_schema.return_value = comprehensive_sheet_schema
+        definitions = [
+            AgentDefinition(agent_id=f"agent_{i}", name=f"Agent {i}", starter_prompt="Prompt",
+                            sheet_url=f"https://docs.google.com/spreadsheets/d/sheet{i % 2}/")
+            for i in range(4)
+        ]
+
+        configs = FullAgentConfig.from_definitions(definitions, Mock())
+
+        assert [config.definition for config in configs] == definitions
+        parsed_urls = sorted(call.args[0] for call in mock_reader_class.return_value.parse_sheet_schema.call_args_list)
+        assert parsed_urls == ["https://docs.google.com/spreadsheets/d/sheet0/",
+                               "https://docs.google.com/spreadsheets/d/sheet1/"]
+
+        FullAgentConfig.from_definitions(definitions, Mock())
+        assert mock_reader_class.return_value.parse_sheet_schema.call_count == 2
+
+    @patch.dict('common.config.models._SCHEMA_CACHE', clear=True)
+    @patch('common.config.models.is_testing_mode', return_value=False)
+    @patch('common.config.models.SheetSchemaReader')
+    def test_sheet_schema_persisted_across_processes(self, mock_reader_class, _mock_testing, mock_agent_definition,
+                                                     comprehensive_sheet_schema, tmp_path, monkeypatch):
+        """Test a schema saved to disk is reused after the in-process cache is lost."""
+        from common.config.models import _SCHEMA_CACHE
+        monkeypatch.setenv("SCHEMA_CACHE_PATH", str(tmp_path / "schema_cache.json"))
+        mock_reader_class.return_value.parse_sheet_schema.return_value = comprehensive_sheet_schema
+
+        first = FullAgentConfig.from_definition(mock_agent_definition, Mock())
+        _SCHEMA_CACHE.clear()
+        second = FullAgentConfig.from_definition(mock_agent_definition, Mock())
+
+        assert second.schema == first.schema
+        mock_reader_class.return_value.parse_sheet_schema.assert_called_once()
+
+        _SCHEMA_CACHE.clear()
+        with patch('common.config.models.time.time', return_value=time.time() + 301):
+            FullAgentConfig.from_definition(mock_agent_definition, Mock())
+        assert mock_reader_class.return_value.parse_sheet_schema.call_count == 2
+
 class TestConfigurationIntegration:
     """Test integration between all configuration components."""
     
@@ -185,4 +185,20 @@ class TestJinjaTemplateIntegration:
             assert len(rendered_prompt) > 0
             
         except Exception as e:
-            pytest.fail(f"Template should handle special characters: {str(e)}")
\ No newline at end of file
+            pytest.fail(f"Template should handle special characters: {str(e)}")
+
+    def test_synthesis_template_compiled_once(self):
+        """Test repeated renders reuse the compiled template."""
+        from unittest.mock import patch
+
+        prompt_manager._get_jinja_template('synthesis_call')
+        with patch('common.prompt_manager.Template') as mock_template:
+            rendered_prompt = prompt_manager.format_synthesis_call_prompt(
+                research_results=[],
+                user_input={"Test_Input": "value"},
+                agent_personality="Test agent",
+                output_fields=[]
+            )
+
+        mock_template.assert_not_called()
+        assert "Test agent" in rendered_prompt
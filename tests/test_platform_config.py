@@ -4,6 +4,7 @@ Comprehensive tests for Universal AI Agent Platform configuration.
 Tests platform.yaml loading, universal settings, and platform-level validation.
 """
 
+import json
 import pytest
 import os
 import yaml
@@ -113,6 +114,26 @@ class TestPlatformConfiguration:
                     assert len(prompts[prompt_type]) > 50
 
 
+    def test_platform_config_loaded_once_until_cleared(self):
+        """Test platform.yaml is parsed once and reloaded after clear_cache()."""
+        from common.prompt_manager import PromptManager
+
+        manager = PromptManager()
+        with patch('common.prompt_manager.yaml.safe_load', wraps=yaml.safe_load) as mock_load:
+            first = manager._load_common_config()
+            assert manager._load_common_config() is first
+            assert mock_load.call_count == 1
+
+            manager.clear_cache()
+            assert manager._load_common_config() is not first
+            assert mock_load.call_count == 2
+
+            assert manager.get_model('synthesis') == first['platform']['models']['synthesis']
+            assert manager.get_prompt_template('research_call') == first['platform']['prompts']['research_call']
+            assert mock_load.call_count == 2
+            with pytest.raises(ValueError, match="Unknown model type"):
+                manager.get_model('nonexistent')
+
 class TestPlatformIntegration:
     """Test platform configuration integration with existing systems."""
     
@@ -184,6 +205,77 @@ class TestPlatformIntegration:
             # If pricing not available, should handle gracefully
             pytest.skip("Pricing for gpt-4o-mini not yet configured")
 
+    def test_cost_records_buffered_as_json_lines(self, tmp_path):
+        """Test cost records share one file handle and flush as JSON lines."""
+        from common.cost_tracker import CostTracker
+
+        log_path = tmp_path / "costs.log"
+        tracker = CostTracker(str(log_path))
+        try:
+            for i in range(3):
+                tracker.log_api_call(
+                    endpoint="execute_analysis", model="gpt-4o-mini", budget_tier="basic",
+                    job_id=f"job-{i}-0000", usage_data={"total_tokens": 10}, cost_usd=0.01,
+                    user_input={"Idea_Overview": "Test idea"}
+                )
+            handle = tracker._fh
+            assert handle is not None
+
+            tracker.flush()
+            lines = log_path.read_text(encoding="utf-8").splitlines()
+            assert [json.loads(line)["job_id"] for line in lines] == ["job-0-0000", "job-1-0000", "job-2-0000"]
+            assert tracker._fh is handle
+        finally:
+            tracker.close()
+        assert tracker._fh is None
+
+    def test_pending_cost_record_flushed_by_timer(self, tmp_path):
+        """Test a lone buffered record reaches disk without another write."""
+        import time
+        from common.cost_tracker import CostTracker
+
+        log_path = tmp_path / "costs.log"
+        tracker = CostTracker(str(log_path))
+        try:
+            with patch("common.cost_tracker._FLUSH_INTERVAL_SECONDS", 0.05):
+                tracker.log_api_call(
+                    endpoint="execute_analysis", model="gpt-4o-mini", budget_tier="basic",
+                    job_id="job-0-0000", usage_data={"total_tokens": 10}, cost_usd=0.01,
+                    user_input={"Idea_Overview": "Test idea"}
+                )
+            deadline = time.monotonic() + 2.0
+            while tracker._pending_records and time.monotonic() < deadline:
+                time.sleep(0.01)
+            lines = log_path.read_text(encoding="utf-8").splitlines()
+            assert [json.loads(line)["job_id"] for line in lines] == ["job-0-0000"]
+            assert tracker._flush_timer is None
+        finally:
+            tracker.close()
+
+    def test_cost_summary_reads_recent_records_from_end(self, tmp_path):
+        """Test the cost summary stops at the cutoff and keeps the last 10 records in order."""
+        from datetime import datetime, timedelta
+        from common.cost_tracker import CostTracker, _iter_lines_reversed
+
+        now = datetime.utcnow()
+        old = {"timestamp": (now - timedelta(days=40)).isoformat() + "Z", "cost_usd": 5.0, "testing_mode": False}
+        recent = [
+            {"timestamp": (now - timedelta(hours=20 - i)).isoformat() + "Z", "job_id": f"job-{i}",
+             "cost_usd": 0.5, "testing_mode": i % 2 == 0}
+            for i in range(12)
+        ]
+        log_path = tmp_path / "costs.log"
+        log_path.write_text("".join(json.dumps(r) + "\n" for r in [old, *recent]), encoding="utf-8")
+
+        lines = log_path.read_bytes().splitlines()
+        assert list(_iter_lines_reversed(str(log_path), block_size=7)) == lines[::-1]
+
+        summary = CostTracker(str(log_path)).get_cost_summary(days=30)
+        assert summary["total_records"] == 12
+        assert summary["real_api_calls"] == 6
+        assert summary["total_cost_usd"] == 3.0
+        assert [r["job_id"] for r in summary["records"]] == [f"job-{i}" for i in range(2, 12)]
+
 
 class TestPlatformValidation:
     """Test platform-level validation and error handling."""
@@ -252,6 +344,73 @@ class TestPlatformEnvironment:
             # If no API key in testing, should be handled gracefully
             pass
     
+    def test_testing_mode_read_once(self):
+        """Test the configured testing-mode settings are cached until cleared."""
+        from common.http_utils import _configured_testing_mode
+
+        _configured_testing_mode.cache_clear()
+        try:
+            assert _configured_testing_mode() is True
+            with patch('common.http_utils.os.getenv') as mock_getenv:
+                assert _configured_testing_mode() is True
+                mock_getenv.assert_not_called()
+        finally:
+            _configured_testing_mode.cache_clear()
+    
+    def test_testing_mode_sees_pytest_after_early_call(self, monkeypatch):
+        """Test a check made before a test starts cannot disable the pytest charge guard."""
+        from common.http_utils import is_testing_mode, _configured_testing_mode
+
+        monkeypatch.setenv("TESTING_MODE", "false")
+        monkeypatch.delenv("AZURE_FUNCTIONS_ENVIRONMENT", raising=False)
+        pytest_current_test = os.environ["PYTEST_CURRENT_TEST"]
+        _configured_testing_mode.cache_clear()
+        try:
+            # As at import time: pytest has not set PYTEST_CURRENT_TEST yet
+            monkeypatch.delenv("PYTEST_CURRENT_TEST")
+            assert is_testing_mode() is False
+
+            monkeypatch.setenv("PYTEST_CURRENT_TEST", pytest_current_test)
+            assert is_testing_mode() is True
+        finally:
+            _configured_testing_mode.cache_clear()
+    
+    def test_clean_json_response_strips_fences_and_bad_escapes(self):
+        """Test model output is unwrapped from markdown fences and invalid escapes are dropped."""
+        from common.utils import clean_json_response
+
+        assert clean_json_response('```json\n{"price": "\\$5"}\n```') == '{"price": "$5"}'
+        assert clean_json_response('```\n["a"]\n```') == '["a"]'
+        assert clean_json_response('  {"a": "x\\ny"}  ') == '{"a": "x\\ny"}'
+    
+    @patch('common.utils.gspread.authorize')
+    @patch('common.utils.Credentials')
+    def test_service_account_key_parsed_once(self, mock_credentials, mock_authorize, tmp_path):
+        """Test the service account key file is read once for repeated client creation."""
+        from common.utils import get_google_sheets_client, _load_service_account_info
+
+        key_path = tmp_path / "key.json"
+        key_path.write_text(json.dumps({"type": "service_account", "client_email": "bot@example.com"}))
+        _load_service_account_info.cache_clear()
+        try:
+            get_google_sheets_client(str(key_path))
+            get_google_sheets_client(str(key_path))
+            assert _load_service_account_info.cache_info().misses == 1
+            info = mock_credentials.from_service_account_info.call_args.args[0]
+            assert info["client_email"] == "bot@example.com"
+            assert mock_authorize.call_count == 2
+        finally:
+            _load_service_account_info.cache_clear()
+    
+    @patch('common.utils._shared_openai_client', None)
+    @patch('common.utils.get_openai_client')
+    def test_shared_openai_client_created_once(self, mock_get_client):
+        """Test the shared OpenAI client is built once and reused."""
+        from common.utils import get_shared_openai_client
+
+        assert get_shared_openai_client() is get_shared_openai_client()
+        mock_get_client.assert_called_once_with()
+
     def test_required_environment_variables(self):
         """Test that required environment variables are set for testing."""
         required_vars = [
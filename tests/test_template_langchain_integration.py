@@ -101,6 +101,39 @@ class TestTemplateLangChainIntegration:
         assert result.limitations == ""  # Default empty string
         assert result.confidence_level == "medium"  # Default
     
+    def test_layered_parser_fast_path_skips_base_parser(self):
+        """Test plain JSON goes through the fast parser and fenced JSON falls back to the base parser."""
+        import orjson
+        from common.research_models import LayeredParser
+
+        base_parser = Mock()
+        base_parser.parse.return_value = ["From base parser"]
+        parser = LayeredParser(base_parser, fast_parse=orjson.loads)
+
+        assert parser.parse('["Market", "Competition"]') == ["Market", "Competition"]
+        base_parser.parse.assert_not_called()
+
+        assert parser.parse('```json\n["Market"]\n```') == ["From base parser"]
+        base_parser.parse.assert_called_once()
+
+        base_parser.get_format_instructions.return_value = "Return JSON."
+        assert parser.get_format_instructions() == parser.get_format_instructions() == "Return JSON."
+        base_parser.get_format_instructions.assert_called_once()
+
+    def test_fast_parsers_read_fenced_json(self):
+        """Test the fast parse layer reads JSON wrapped in a markdown fence or preamble."""
+        from common.research_models import _loads_json_list, _loads_json_dict, _loads_research_output
+
+        assert _loads_json_list('```json\n["Market", "Competition"]\n```') == ["Market", "Competition"]
+        assert _loads_json_dict('Here is the analysis:\n{"Overall_Rating": "8"}') == {"Overall_Rating": "8"}
+        research = _loads_research_output(
+            '```json\n{"research_topic": "Market", "summary": "Growing", '
+            '"key_findings": ["$5B"], "confidence_level": "high"}\n```'
+        )
+        assert research.research_topic == "Market"
+        with pytest.raises(ValueError):
+            _loads_json_list("No topics available")
+    
     @pytest.mark.asyncio
     async def test_research_call_template_langchain_parse_integration(self):
         """Test complete flow: format_research_call_prompt → LangChain → parse."""
@@ -332,6 +365,59 @@ class TestEnhancedPromptsEffectiveness:
         assert "case studies" in template.lower()
         assert "verifiable information" in template.lower()
     
+    def test_research_call_prompts_share_static_prefix(self):
+        """Test research call prompts put the per-request values after the fixed instructions."""
+        kwargs = dict(
+            starter_prompt="You are a business analyst.",
+            user_input={"Idea_Overview": "Meal planning app"},
+            json_format_instructions="Return JSON.",
+        )
+        market = prompt_manager.format_research_call_prompt(research_topic="Market size", **kwargs)
+        competition = prompt_manager.format_research_call_prompt(research_topic="Competition", **kwargs)
+
+        shared = market.index("Market size")
+        assert competition[:shared] == market[:shared]
+        assert shared > market.index("Return JSON.") > market.index("Quality Standards") > 0
+    
+    def test_synthesis_prompts_share_static_prefix(self):
+        """Test synthesis prompts put the job's request and research after the fixed instructions."""
+        from common.config.models import FieldConfig
+
+        def synthesis_prompt(idea, topic):
+            return prompt_manager.format_synthesis_call_prompt(
+                research_results=[ResearchOutput(
+                    research_topic=topic, summary="Summary", key_findings=["Finding"],
+                    confidence_level="medium",
+                )],
+                user_input={"Idea_Overview": idea},
+                agent_personality="You are a business analyst.",
+                output_fields=[FieldConfig("Overall_Rating", "bot output", "Rating out of 10", 3)],
+            )
+
+        first = synthesis_prompt("Meal planning app", "Market size")
+        second = synthesis_prompt("Fitness tracker", "Competition")
+
+        shared = first.index("Meal planning app")
+        assert second[:shared] == first[:shared]
+        assert shared > first.index("Rating out of 10") > first.index("Synthesis Approach") > 0
+        assert first.index("Market size") > shared
+
+    def test_user_input_formatting_reused_across_research_calls(self):
+        """Test a job's user input is formatted once for all of its research calls."""
+        from common.prompt_manager import _user_input_markdown, _user_input_markdown_cached
+
+        user_input = {"Idea_Overview": "Meal planning app", "Deliverable": "Mobile app"}
+        _user_input_markdown_cached.cache_clear()
+        for topic in ("Market size", "Competition", "Pricing"):
+            prompt = prompt_manager.format_research_call_prompt(
+                starter_prompt="Analyst", research_topic=topic,
+                user_input=user_input, json_format_instructions="Return JSON."
+            )
+            assert "**Idea_Overview**: Meal planning app\n**Deliverable**: Mobile app" in prompt
+        assert _user_input_markdown_cached.cache_info().misses == 1
+
+        assert _user_input_markdown({"Rating": True, "Tags": ["a"]}) == "**Rating**: True\n**Tags**: ['a']"
+    
     def test_synthesis_prompt_includes_analysis_methodology(self):
         """Test that enhanced synthesis prompt provides better analysis guidance.""" 
         template = prompt_manager.get_prompt_template('synthesis_call')
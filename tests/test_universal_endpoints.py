@@ -121,6 +121,43 @@ class TestUniversalEndpointArchitecture:
         assert error_data["error_type"] == "validation_error"
         assert error_data["suggestion"] == "Please check your input format"
 
+    def test_build_error_response_body(self):
+        """Test error bodies carry the message, type, details and status-specific context."""
+        from common.http_utils import build_error_response
+
+        response = build_error_response(
+            'Bad "input"', 400, error_type="validation_error", details={"field": "Idea_Overview"}
+        )
+        assert response.status_code == 400
+        assert json.loads(response.get_body()) == {
+            "error": 'Bad "input"',
+            "status": "error",
+            "success": False,
+            "error_type": "validation_error",
+            "details": {"field": "Idea_Overview"},
+            "suggestion": "Please check your request format and required fields",
+            "testing_mode": True,
+            "note": "Running in testing mode - no API charges incurred",
+        }
+
+        with patch('common.http_utils.is_testing_mode', return_value=False):
+            response = build_error_response("Not found", 404, log_level="info")
+        assert json.loads(response.get_body()) == {"error": "Not found", "status": "error", "success": False}
+
+    def test_validate_json_request(self):
+        """Test request bodies parse to a dict and bad bodies raise ValueError."""
+        from common.http_utils import validate_json_request
+
+        def make_request(body: bytes) -> func.HttpRequest:
+            return func.HttpRequest(method="POST", url="/api/execute_analysis", body=body)
+
+        assert validate_json_request(make_request(b'{"budget_tier": "basic"}')) == {"budget_tier": "basic"}
+
+        for body, message in [(b"", "Request body is required"), (b"{}", "Request body is required"),
+                              (b"{not json", "Invalid JSON"), (b"[1, 2]", "must be a JSON object")]:
+            with pytest.raises(ValueError, match=message):
+                validate_json_request(make_request(body))
+
 
 class TestReadSheetEndpoint:
     """Test read_sheet endpoint with universal sheet access."""